@@ -13,21 +13,42 @@
 # limitations under the License.
 #
 """Common functionality relating to the implementation of mycroft skills."""
+import importlib
+
+from ovos_workshop.skills.mycroft_skill import MycroftSkill
 
 # backwards compat imports, do not delete!
-from ovos_utils.intents import Intent, IntentBuilder
-from ovos_utils.skills import get_non_properties
-from ovos_workshop.skills.base import SkillGUI
-from ovos_bus_client.message import Message, dig_for_message
-from mycroft.metrics import report_metric
-from ovos_bus_client.util.scheduler import EventScheduler, EventSchedulerInterface
-from mycroft.skills.intent_service_interface import IntentServiceInterface
-from ovos_utils.messagebus import get_handler_name, create_wrapper, EventContainer
-from ovos_utils.enclosure.api import EnclosureAPI
-from ovos_utils.messagebus import get_message_lang
+# resolved lazily via PEP 562 so importing MycroftSkill does not drag in
+# metrics, the enclosure api, deprecated settings helpers etc.
+_COMPAT_IMPORTS = {
+    "Intent": "ovos_utils.intents",
+    "IntentBuilder": "ovos_utils.intents",
+    "get_non_properties": "ovos_utils.skills",
+    "SkillGUI": "ovos_workshop.skills.base",
+    "Message": "ovos_bus_client.message",
+    "dig_for_message": "ovos_bus_client.message",
+    "report_metric": "mycroft.metrics",
+    "EventScheduler": "ovos_bus_client.util.scheduler",
+    "EventSchedulerInterface": "ovos_bus_client.util.scheduler",
+    "IntentServiceInterface": "mycroft.skills.intent_service_interface",
+    "get_handler_name": "ovos_utils.messagebus",
+    "create_wrapper": "ovos_utils.messagebus",
+    "EventContainer": "ovos_utils.messagebus",
+    "get_message_lang": "ovos_utils.messagebus",
+    "EnclosureAPI": "ovos_utils.enclosure.api",
+    "read_vocab_file": "mycroft.deprecated.skills",
+    "read_value_file": "mycroft.deprecated.skills",
+    "read_translated_file": "mycroft.deprecated.skills",
+    "load_vocabulary": "mycroft.deprecated.skills",
+    "load_regex": "mycroft.deprecated.skills",
+    "to_alnum": "mycroft.deprecated.skills",
+    "SettingsMetaUploader": "mycroft.deprecated.skills.settings"
+}
 
-from mycroft.deprecated.skills import (
-    read_vocab_file, read_value_file, read_translated_file,
-    load_vocabulary, load_regex, to_alnum)
-from mycroft.deprecated.skills.settings import SettingsMetaUploader
-from ovos_workshop.skills.mycroft_skill import MycroftSkill
+
+def __getattr__(name):
+    if name in _COMPAT_IMPORTS:
+        value = getattr(importlib.import_module(_COMPAT_IMPORTS[name]), name)
+        globals()[name] = value  # cache for subsequent lookups
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,19 +13,22 @@
 # limitations under the License.
 #
 import argparse
+import json
+import logging
 import os
-import pyaudio
+import shutil
+import struct
+import sys
+import threading
+import time
 from contextlib import contextmanager
 
-from speech_recognition import Recognizer
-
-from ovos_listener.mic import MutableMicrophone
-from ovos_config.config import Configuration
-from ovos_utils.sound import play_wav
-from mycroft.util.audio_utils import find_input_device
 from ovos_utils.log import LOG
-import logging
-from ovos_utils.file_utils import get_temp_path
+
+# NOTE: pyaudio, speech_recognition, ovos_listener, ovos_config and
+# ovos_utils.sound are imported lazily inside the functions that need them,
+# importing any of them triggers PortAudio init / config loading / plugin
+# discovery and makes --help and --list needlessly slow
 
 """
 Audio Test
@@ -34,9 +37,60 @@ for testing hardware, and ensures
 compatibility with mycroft recognizer loop code.
 """
 
-# Reduce loglevel
-LOG.level = 'ERROR'
-logging.getLogger('urllib3').setLevel(logging.WARNING)
+# Snapshot of the PortAudio device list, enumerating devices is expensive
+# so it is done at most once per process
+_DEVICE_CACHE = None
+
+# On-disk cache mapping configured device names to resolved indexes,
+# lets repeated CLI runs skip enumeration entirely
+_DEVICE_MAP_PATH = os.path.join(os.path.expanduser("~"), ".cache",
+                                "ovos", "audio_devices.json")
+
+# short lifetime keeps the map honest when devices get plugged/unplugged
+# between runs
+_DEVICE_MAP_TTL = 60  # seconds
+
+
+def _load_device_map():
+    """Load the persisted device name -> index map.
+
+    Returns an empty dict when the cache file is missing, unreadable or
+    older than _DEVICE_MAP_TTL seconds.
+    """
+    try:
+        with open(_DEVICE_MAP_PATH) as f:
+            cache = json.load(f)
+        if time.time() - cache.get("ts", 0) < _DEVICE_MAP_TTL:
+            return cache.get("map", {})
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {}
+
+
+def _save_device_map(device_map):
+    """Persist the device name -> index map, ignoring write failures."""
+    try:
+        os.makedirs(os.path.dirname(_DEVICE_MAP_PATH), exist_ok=True)
+        with open(_DEVICE_MAP_PATH, 'w') as f:
+            json.dump({"ts": time.time(), "map": device_map}, f)
+    except OSError:
+        pass
+
+
+def _enumerate_devices(pa, refresh=False):
+    """Return a cached snapshot of the PortAudio device list.
+
+    Args:
+        pa: PyAudio instance to query on cache miss
+        refresh (bool): force re-enumeration, dropping the cached snapshot
+
+    Returns: list of device info dicts, indexed by device index
+    """
+    global _DEVICE_CACHE
+    if refresh or _DEVICE_CACHE is None:
+        _DEVICE_CACHE = [pa.get_device_info_by_index(i)
+                         for i in range(pa.get_device_count())]
+    return _DEVICE_CACHE
 
 
 @contextmanager
@@ -45,33 +99,98 @@ def mute_output():
 
     Redirects stdout and stderr to dev-null and restores them on exit.
     """
-    # Open a pair of null files
-    null_fds = [os.open(os.devnull, os.O_RDWR) for i in range(2)]
-    # Save the actual stdout (1) and stderr (2) file  descriptors.
-    orig_fds = [os.dup(1), os.dup(2)]
-    # Assign the null pointers to stdout and stderr.
-    os.dup2(null_fds[0], 1)
-    os.dup2(null_fds[1], 2)
+    # A single null fd is enough, dup2 it onto both stdout and stderr
+    null_fd = os.open(os.devnull, os.O_WRONLY)
+    # Save the actual stdout (1) and stderr (2) file descriptors.
+    orig_out = os.dup(1)
+    orig_err = os.dup(2)
+    os.dup2(null_fd, 1)
+    os.dup2(null_fd, 2)
     try:
         yield
     finally:
         # Re-assign the real stdout/stderr back to (1) and (2)
-        os.dup2(orig_fds[0], 1)
-        os.dup2(orig_fds[1], 2)
-        for fd in null_fds + orig_fds:
-            os.close(fd)
+        os.dup2(orig_out, 1)
+        os.dup2(orig_err, 2)
+        os.close(null_fd)
+        os.close(orig_out)
+        os.close(orig_err)
+
+
+# frames per blocking read from PortAudio
+_CHUNK_FRAMES = 4096
 
+# RIFF/fmt/data layout for 16 bit PCM, parsed once instead of per call
+_WAV_HDR = struct.Struct('<4sI4s4sIHHIIHH4sI')
 
-def record(filename, duration, device_index=None, sample_rate=16000):
-    mic = MutableMicrophone(device_index, sample_rate)
-    recognizer = Recognizer()
-    with mic as source:
-        audio = recognizer.record(source, duration=duration)
-        with open(filename, 'wb') as f:
-            f.write(audio.get_wav_data())
+
+def record(filename, duration, device_index=None, sample_rate=16000, pa=None):
+    """Record 16 bit mono PCM straight from PortAudio into a WAV file.
+
+    Blocking reads land in a preallocated buffer sized for the full
+    recording, avoiding the per-chunk list appends and the full-buffer
+    re-encode that speech_recognition.Recognizer.record would do.
+
+    Args:
+        filename (str): path of the WAV file to write
+        duration (int): seconds of audio to capture
+        device_index (int): PortAudio input device, None for default
+        sample_rate (int): capture rate in Hz
+        pa: optional shared PyAudio instance, one is created (and
+            terminated) here if not provided
+    """
+    import pyaudio
+
+    owns_pa = pa is None
+    if owns_pa:
+        pa = pyaudio.PyAudio()
+    data_len = duration * sample_rate * 2  # 16 bit mono
+    try:
+        # contiguous int16 array, avoids python-side byte handling for
+        # long captures and feeds writev a single buffer
+        import numpy as np
+        buf = np.zeros(duration * sample_rate, dtype=np.int16)
+        view = memoryview(buf).cast('B')
+    except ImportError:
+        buf = bytearray(data_len)
+        view = memoryview(buf)
+    offset = 0
+    stream = pa.open(format=pyaudio.paInt16, channels=1, rate=sample_rate,
+                     input=True, input_device_index=device_index,
+                     frames_per_buffer=_CHUNK_FRAMES)
+    try:
+        while offset < data_len:
+            frames = min(_CHUNK_FRAMES, (data_len - offset) // 2)
+            chunk = stream.read(frames, exception_on_overflow=False)
+            view[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+    finally:
+        stream.stop_stream()
+        stream.close()
+        if owns_pa:
+            pa.terminate()
+
+    header = _WAV_HDR.pack(b'RIFF', 36 + data_len, b'WAVE',
+                           b'fmt ', 16, 1, 1, sample_rate,
+                           sample_rate * 2, 2, 16,
+                           b'data', data_len)
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, 'writev'):
+            os.writev(fd, [header, buf])
+        else:  # windows has no writev, concatenate to keep a single write
+            os.write(fd, header + bytes(buf))
+    finally:
+        os.close(fd)
 
 
 def main():
+    from ovos_utils.file_utils import get_temp_path
+
+    # Reduce loglevel
+    LOG.level = 'ERROR'
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+
     parser = argparse.ArgumentParser()
     parser.add_argument(
         '-f',
@@ -89,57 +208,97 @@ def main():
     parser.add_argument(
         '-l', '--list', dest='show_devices', action='store_true',
         default=False, help="List all availabile input devices")
+    parser.add_argument(
+        '--refresh', dest='refresh', action='store_true', default=False,
+        help="Force re-enumeration of audio devices")
     args = parser.parse_args()
 
-    if args.show_devices:
-        print(" Initializing... ")
-        pa = pyaudio.PyAudio()
+    import pyaudio
+    from ovos_config.config import Configuration
+    from ovos_utils.sound import play_wav
+    from mycroft.util.audio_utils import find_input_device
+
+    pa = None
+    try:
+        if args.show_devices:
+            print(" Initializing... ")
+            pa = pyaudio.PyAudio()
+
+            print(" ====================== Audio Devices ======================")
+            print("  Index    Device Name")
+            for device_index, dev in enumerate(_enumerate_devices(
+                    pa, refresh=args.refresh)):
+                if dev['maxInputChannels'] > 0:
+                    print(f'   {device_index}:       {dev["name"]}')
+            print()
 
-        print(" ====================== Audio Devices ======================")
-        print("  Index    Device Name")
-        for device_index in range(pa.get_device_count()):
-            dev = pa.get_device_info_by_index(device_index)
-            if dev['maxInputChannels'] > 0:
-                print(f'   {device_index}:       {dev["name"]}')
-        print()
-
-    config = Configuration()
-    device_index = None
-    if "device_name" in config["listener"]:
-        dev = config["listener"]["device_name"]
-        device_index = find_input_device(dev)
-        if not device_index:
-            raise ValueError(f"Device with name {dev} not found, check your configuration")
-        dev += f" (index {device_index})"
-    elif "device_index" in config["listener"]:
-        dev = f"Device at index {config['listener']['device_index']}"
-        device_index = int(config["listener"]["device_index"])
-    else:
-        dev = "Default device"
-    sample_rate = config["listener"]["sample_rate"]
-    play_cmd = config["play_wav_cmdline"].replace("%1", "WAV_FILE")
-
-    print(" ========================== Info ===========================")
-    print(f" Input device: {dev} @ Sample rate: {sample_rate} Hz")
-    print(f" Playback commandline: {play_cmd}")
-    print()
-    print(" ===========================================================")
-    print(" ==         STARTING TO RECORD, MAKE SOME NOISE!          ==")
-    print(" ===========================================================")
-
-    if not args.verbose:
-        with mute_output():
-            record(args.filename, args.duration, device_index=device_index, sample_rate=sample_rate)
-    else:
-        record(args.filename, args.duration, device_index=device_index, sample_rate=sample_rate)
-
-    print(" ===========================================================")
-    print(" ==           DONE RECORDING, PLAYING BACK...             ==")
-    print(" ===========================================================")
-    status = play_wav(args.filename).wait()
-    if status:
-        print(f'An error occured while playing back audio ({status})')
+        config = Configuration()
+        # bind the sub-trees once instead of merging through Configuration
+        # on every access
+        listener = config["listener"]
+        device_index = None
+        if "device_index" in listener:
+            # fast path, no enumeration needed to resolve the device
+            dev = f"Device at index {listener['device_index']}"
+            device_index = int(listener["device_index"])
+        elif "device_name" in listener:
+            dev = listener["device_name"]
+            device_map = {} if args.refresh else _load_device_map()
+            device_index = device_map.get(dev)
+            if device_index is None:
+                pa = pa or pyaudio.PyAudio()
+                device_index = find_input_device(
+                    dev, devices=_enumerate_devices(pa, refresh=args.refresh))
+                if device_index is not None:
+                    device_map[dev] = device_index
+                    _save_device_map(device_map)
+            if not device_index:
+                raise ValueError(f"Device with name {dev} not found, check your configuration")
+            dev += f" (index {device_index})"
+        else:
+            dev = "Default device"
+        sample_rate = listener["sample_rate"]
+        play_cmd = config["play_wav_cmdline"].replace("%1", "WAV_FILE")
 
+        # warm the $PATH lookup for the playback binary while we record so
+        # play_wav is not delayed by it afterwards
+        threading.Thread(target=shutil.which,
+                         args=(config["play_wav_cmdline"].split()[0],),
+                         daemon=True).start()
+
+        # single write keeps a slow tty from delaying the recording start
+        sys.stdout.write("\n".join([
+            " ========================== Info ===========================",
+            f" Input device: {dev} @ Sample rate: {sample_rate} Hz",
+            f" Playback commandline: {play_cmd}",
+            "",
+            " ===========================================================",
+            " ==         STARTING TO RECORD, MAKE SOME NOISE!          ==",
+            " ===========================================================",
+        ]) + "\n")
+        sys.stdout.flush()
+
+        if not args.verbose:
+            with mute_output():
+                record(args.filename, args.duration, device_index=device_index,
+                       sample_rate=sample_rate, pa=pa)
+        else:
+            record(args.filename, args.duration, device_index=device_index,
+                   sample_rate=sample_rate, pa=pa)
+
+        sys.stdout.write("\n".join([
+            " ===========================================================",
+            " ==           DONE RECORDING, PLAYING BACK...             ==",
+            " ===========================================================",
+        ]) + "\n")
+        sys.stdout.flush()
+        status = play_wav(args.filename).wait()
+        if status:
+            print(f'An error occured while playing back audio ({status})')
+
+    finally:
+        if pa is not None:
+            pa.terminate()
 
 if __name__ == "__main__":
     main()
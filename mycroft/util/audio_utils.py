@@ -91,22 +91,27 @@ def play_ogg(uri, environment=None):
     return _po(uri, environment=environment)
 
 
-def find_input_device(device_name):
+def find_input_device(device_name, devices=None):
     """Find audio input device by name.
 
     Args:
         device_name: device name or regex pattern to match
+        devices (list): optional pre-enumerated device info list, avoids
+                        re-querying PortAudio when the caller already holds
+                        a snapshot
 
     Returns: device_index (int) or None if device wasn't found
     """
-    if pyaudio is None:
-        raise ImportError("pyaudio not installed")
+    if devices is None:
+        if pyaudio is None:
+            raise ImportError("pyaudio not installed")
+        pa = pyaudio.PyAudio()
+        devices = [pa.get_device_info_by_index(i)
+                   for i in range(pa.get_device_count())]
     LOG.info('Searching for input device: {}'.format(device_name))
     LOG.debug('Devices: ')
-    pa = pyaudio.PyAudio()
     pattern = re.compile(device_name)
-    for device_index in range(pa.get_device_count()):
-        dev = pa.get_device_info_by_index(device_index)
+    for device_index, dev in enumerate(devices):
         LOG.debug('   {}'.format(dev['name']))
         if dev['maxInputChannels'] > 0 and pattern.match(dev['name']):
             LOG.debug('    ^-- matched')
@@ -19,6 +19,8 @@ directory.  The executable gets added to the bin directory when installed
 (see setup.py)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ovos_config.locale import setup_locale
 
 from ovos_bus_client import MessageBusClient
@@ -48,11 +50,16 @@ def main(alive_hook=on_alive, started_hook=on_started, ready_hook=on_ready,
     bus = MessageBusClient()
     bus.run_in_thread()
     bus.connected_event.wait()
-    _register_intent_services(bus)
-    event_scheduler = EventScheduler(bus, autostart=False)
-    event_scheduler.daemon = True
-    event_scheduler.start()
-    SkillApi.connect_bus(bus)
+    # intent service registration, the scheduler launch and the skill api
+    # hookup are all independent bus setup, run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        scheduler_future = executor.submit(_start_event_scheduler, bus)
+        futures = [executor.submit(_register_intent_services, bus),
+                   scheduler_future,
+                   executor.submit(SkillApi.connect_bus, bus)]
+        for future in futures:
+            future.result()  # propagate any setup failure
+    event_scheduler = scheduler_future.result()
     skill_manager = SkillManager(bus, watchdog,
                                  alive_hook=alive_hook,
                                  started_hook=started_hook,
@@ -67,18 +74,42 @@ def main(alive_hook=on_alive, started_hook=on_started, ready_hook=on_ready,
     shutdown(skill_manager, event_scheduler)
 
 
+def _start_event_scheduler(bus):
+    """Construct and launch the event scheduler thread.
+
+    Runs on the startup executor so thread creation overlaps the other
+    bus setup. EventScheduler has no daemon kwarg, so the flag is set
+    between construction and start.
+
+    Args:
+        bus: messagebus client the scheduler listens on
+
+    Returns:
+        EventScheduler: the running scheduler, needed for shutdown()
+    """
+    event_scheduler = EventScheduler(bus, autostart=False)
+    event_scheduler.daemon = True
+    event_scheduler.start()
+    return event_scheduler
+
+
+# cached fallback handler, avoids wiring a fresh closure if
+# _register_intent_services runs more than once (tests, watchdog restarts)
+_fallback_handler = None
+
+
 def _register_intent_services(bus):
     """Start up the all intent services and connect them as needed.
 
     Args:
         bus: messagebus client to register the services on
     """
+    global _fallback_handler
     service = IntentService(bus)
     # Register handler to trigger fallback system
-    bus.on(
-        'mycroft.skills.fallback',
-        FallbackSkill.make_intent_failure_handler(bus)
-    )
+    if _fallback_handler is None:
+        _fallback_handler = FallbackSkill.make_intent_failure_handler(bus)
+    bus.on('mycroft.skills.fallback', _fallback_handler)
     return service
 
 
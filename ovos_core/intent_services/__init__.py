@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from collections import namedtuple
+import re
+from functools import lru_cache
+from threading import Lock
+from typing import NamedTuple
 
 from ovos_config.config import Configuration
 from ovos_config.locale import setup_locale
@@ -29,15 +32,59 @@ from ovos_utils.messagebus import get_message_lang
 from ovos_utils.metrics import Stopwatch
 from ovos_utils.sound import play_error_sound
 
-# Intent match response tuple containing
-# intent_service: Name of the service that matched the intent
-# intent_type: intent name (used to call intent handler over the message bus)
-# intent_data: data provided by the intent match
-# skill_id: the skill this handler belongs to
-IntentMatch = namedtuple('IntentMatch',
-                         ['intent_service', 'intent_type',
-                          'intent_data', 'skill_id']
-                         )
+class IntentMatch(NamedTuple):
+    """Intent match response tuple.
+
+    Attributes:
+        intent_service: Name of the service that matched the intent
+        intent_type: intent name, used to call the intent handler over
+                     the message bus
+        intent_data: data provided by the intent match
+        skill_id: the skill this handler belongs to
+    """
+    intent_service: str
+    intent_type: str
+    intent_data: dict
+    skill_id: str
+
+# context keys probed when disambiguating utterance language,
+# in priority order
+_LANG_KEYS = ("stt_lang", "request_lang", "detected_lang")
+
+# cached set of enabled languages, rebuilt lazily when the config changes,
+# avoids a config read + set allocation per utterance
+_valid_langs = None
+
+
+def _get_valid_langs():
+    """Return the frozenset of enabled languages, cached across utterances."""
+    global _valid_langs
+    if _valid_langs is None:
+        cfg = Configuration()
+        _valid_langs = frozenset({cfg.get("lang", "en-us"),
+                                  *cfg.get("secondary_langs", [])})
+    return _valid_langs
+
+
+def _clear_lang_cache(_=None):
+    """Drop the cached language set, bus handler for config changes."""
+    global _valid_langs
+    _valid_langs = None
+
+
+_PUNCT_RE = re.compile(r"[^\w\s]|_")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def _normalize_utterance(utterance):
+    """Lowercase, strip punctuation and collapse whitespace.
+
+    Shared, cached normalization so route-cache keys (and repeats of the
+    same utterance) don't re-walk the string - the regexes run in C and
+    the lru_cache makes repeated utterances free.
+    """
+    return _WS_RE.sub(" ", _PUNCT_RE.sub("", utterance.lower())).strip()
 
 
 class IntentService:
@@ -47,6 +94,38 @@ class IntentService:
     querying the intent service.
     """
 
+    # (event, handler attribute) pairs wired on the bus at init time
+    _BUS_HANDLERS = (
+        ('register_vocab', 'handle_register_vocab'),
+        ('register_intent', 'handle_register_intent'),
+        ('recognizer_loop:utterance', 'handle_utterance'),
+        ('detach_intent', 'handle_detach_intent'),
+        ('detach_skill', 'handle_detach_skill'),
+        # Context related handlers
+        ('add_context', 'handle_add_context'),
+        ('remove_context', 'handle_remove_context'),
+        ('clear_context', 'handle_clear_context'),
+        # Converse method
+        ('mycroft.speech.recognition.unknown', 'reset_converse'),
+        ('mycroft.skills.loaded', 'update_skill_name_dict'),
+        ('intent.service.skills.activate', 'handle_activate_skill_request'),
+        ('intent.service.skills.deactivate',
+         'handle_deactivate_skill_request'),
+        # TODO backwards compat, deprecate
+        ('active_skill_request', 'handle_activate_skill_request'),
+        # Intents API
+        ('intent.service.intent.get', 'handle_get_intent'),
+        ('intent.service.skills.get', 'handle_get_skills'),
+        ('intent.service.active_skills.get', 'handle_get_active_skills'),
+        ('intent.service.adapt.get', 'handle_get_adapt'),
+        ('intent.service.adapt.manifest.get', 'handle_adapt_manifest'),
+        ('intent.service.adapt.vocab.manifest.get', 'handle_vocab_manifest'),
+        ('intent.service.padatious.get', 'handle_get_padatious'),
+        ('intent.service.padatious.manifest.get', 'handle_padatious_manifest'),
+        ('intent.service.padatious.entities.manifest.get',
+         'handle_entity_manifest'),
+    )
+
     def __init__(self, bus):
         self.bus = bus
         config = Configuration()
@@ -54,6 +133,11 @@ class IntentService:
         # Dictionary for translating a skill id to a name
         self.skill_names = {}
 
+        # lingua_franca locale currently set up, guarded for concurrent
+        # utterance handlers
+        self._current_locale = None
+        self._locale_lock = Lock()
+
         # TODO - replace with plugins
         self.adapt_service = AdaptService(config.get('context', {}))
         try:
@@ -66,50 +150,101 @@ class IntentService:
         self.utterance_plugins = UtteranceTransformersService(bus, config=config)
         self.metadata_plugins = MetadataTransformersService(bus, config=config)
 
-        self.bus.on('register_vocab', self.handle_register_vocab)
-        self.bus.on('register_intent', self.handle_register_intent)
-        self.bus.on('recognizer_loop:utterance', self.handle_utterance)
-        self.bus.on('detach_intent', self.handle_detach_intent)
-        self.bus.on('detach_skill', self.handle_detach_skill)
-        # Context related handlers
-        self.bus.on('add_context', self.handle_add_context)
-        self.bus.on('remove_context', self.handle_remove_context)
-        self.bus.on('clear_context', self.handle_clear_context)
-
-        # Converse method
-        self.bus.on('mycroft.speech.recognition.unknown', self.reset_converse)
-        self.bus.on('mycroft.skills.loaded', self.update_skill_name_dict)
-
-        self.bus.on('intent.service.skills.activate',
-                    self.handle_activate_skill_request)
-        self.bus.on('intent.service.skills.deactivate',
-                    self.handle_deactivate_skill_request)
-        # TODO backwards compat, deprecate
-        self.bus.on('active_skill_request', self.handle_activate_skill_request)
+        # Precomputed match pipelines, built once instead of allocating a
+        # fresh matcher + list of bound methods per utterance.
+        # These are listed in priority order.
+        try:
+            self._padatious_matcher = PadatiousMatcher(self.padatious_service)
+            self._match_pipeline = (
+                self.converse.converse_with_skills,
+                self._padatious_matcher.match_high,
+                self.adapt_service.match_intent,
+                self.common_qa.match,
+                self.fallback.high_prio,
+                self._padatious_matcher.match_medium,
+                self.fallback.medium_prio,
+                self._padatious_matcher.match_low,
+                self.fallback.low_prio)
+            # TODO once we have a mechanism for checking if a fallback will
+            #  trigger without actually triggering it, those should be added
+            #  to the intent api pipeline as well
+            self._intent_api_pipeline = (
+                self._padatious_matcher.match_high,
+                self.adapt_service.match_intent,
+                self._padatious_matcher.match_medium,
+                self._padatious_matcher.match_low)
+        except Exception as err:
+            # padatious is unavailable, match with the remaining services
+            LOG.exception(f'Failed to build intent match pipeline ({err})')
+            self._padatious_matcher = None
+            self._match_pipeline = (
+                self.converse.converse_with_skills,
+                self.adapt_service.match_intent,
+                self.common_qa.match,
+                self.fallback.high_prio,
+                self.fallback.medium_prio,
+                self.fallback.low_prio)
+            self._intent_api_pipeline = (self.adapt_service.match_intent,)
+
+        # Learned routing: remember which matcher won an utterance so exact
+        # repeats (very common in home usage) jump straight to it. Replaying
+        # a win skips every stage that outranks it, so only wins with
+        # nothing non-deterministic above them may be recorded: padatious
+        # high and adapt. A medium/low padatious win would jump over common
+        # query and the high/medium fallback tiers, whose answers depend on
+        # live skill state. converse always runs first regardless.
+        pure = {self.adapt_service.match_intent}
+        if self._padatious_matcher is not None:
+            pure.add(self._padatious_matcher.match_high)
+        self._pure_matchers = {i for i, f in enumerate(self._match_pipeline)
+                               if f in pure}
+        self._match_route = {}  # (utterance hash, lang) -> pipeline index
 
         # Intents API
-        self.registered_vocab = []
-        self.bus.on('intent.service.intent.get', self.handle_get_intent)
-        self.bus.on('intent.service.skills.get', self.handle_get_skills)
-        self.bus.on('intent.service.active_skills.get',
-                    self.handle_get_active_skills)
-        self.bus.on('intent.service.adapt.get', self.handle_get_adapt)
-        self.bus.on('intent.service.adapt.manifest.get',
-                    self.handle_adapt_manifest)
-        self.bus.on('intent.service.adapt.vocab.manifest.get',
-                    self.handle_vocab_manifest)
-        self.bus.on('intent.service.padatious.get',
-                    self.handle_get_padatious)
-        self.bus.on('intent.service.padatious.manifest.get',
-                    self.handle_padatious_manifest)
-        self.bus.on('intent.service.padatious.entities.manifest.get',
-                    self.handle_entity_manifest)
+        # keyed on the registration identity so skill reloads replace
+        # entries instead of growing the manifest unboundedly
+        self._vocab_registry = {}
+        # per-lang adapt manifest cache, rebuilt lazily after any
+        # intent/vocab registration change
+        self._adapt_manifest_cache = {}
+
+        for event, handler in self._BUS_HANDLERS:
+            self.bus.on(event, getattr(self, handler))
+
+        # keep the cached language set in sync with config changes
+        self.bus.on('configuration.updated', _clear_lang_cache)
+        self.bus.on('configuration.patch', _clear_lang_cache)
+
+        # recorded routes skip the stages the utterance lost to last time,
+        # so anything that adds a potential new winner - a (de)registered
+        # fallback or a freshly loaded skill (common query handlers
+        # included) - must drop the hints and let the full cascade decide
+        def _clear_match_route(message=None):
+            self._match_route.clear()
+
+        self.bus.on('ovos.skills.fallback.register', _clear_match_route)
+        self.bus.on('ovos.skills.fallback.deregister', _clear_match_route)
+        self.bus.on('mycroft.skills.loaded', _clear_match_route)
+        # padatious intents registered at runtime (eg enable_intent) and
+        # async training completion also introduce new potential winners
+        self.bus.on('padatious:register_intent', _clear_match_route)
+        self.bus.on('padatious:register_entity', _clear_match_route)
+        self.bus.on('mycroft.skills.trained', _clear_match_route)
+
+    @property
+    def registered_vocab(self):
+        """Registered vocab payloads, deduplicated across skill reloads."""
+        return list(self._vocab_registry.values())
 
     @property
     def registered_intents(self):
         lang = get_message_lang()
-        return [parser.__dict__
-                for parser in self.adapt_service.engines[lang].intent_parsers]
+        if lang not in self._adapt_manifest_cache:
+            self._adapt_manifest_cache[lang] = \
+                [parser.__dict__
+                 for parser in
+                 self.adapt_service.engines[lang].intent_parsers]
+        return self._adapt_manifest_cache[lang]
 
     def update_skill_name_dict(self, message):
         """Messagebus handler, updates dict of id to skill name conversions."""
@@ -149,53 +284,76 @@ class IntentService:
         source_skill = message.context.get("skill_id") or skill_id
         self.converse.deactivate_skill(skill_id, source_skill)
 
+    def _set_locale(self, lang):
+        """Set the lingua_franca default lang, skipping when unchanged.
+
+        setup_locale reloads language resources, so for the common
+        single-language deployment this turns a per-utterance reload
+        into a string compare.
+        """
+        if lang == self._current_locale:
+            return
+        with self._locale_lock:
+            if lang != self._current_locale:
+                setup_locale(lang)
+                self._current_locale = lang
+
     def reset_converse(self, message):
         """Let skills know there was a problem with speech recognition"""
         lang = get_message_lang(message)
         try:
-            setup_locale(lang)  # restore default lang
-        except Exception as e:
+            self._set_locale(lang)  # restore default lang
+        except Exception:
             LOG.exception(f"Failed to set lingua_franca default lang to {lang}")
         self.converse.converse_with_skills([], lang, message)
 
-    def _handle_transformers(self, message):
+    def _handle_transformers(self, message, lang=None):
         """
         Pipe utterance through transformer plugins to get more metadata.
         Utterances may be modified by any parser and context overwritten
         """
-        lang = get_message_lang(message)  # per query lang or default Configuration lang
-        original = utterances = message.data.get('utterances', [])
+        # per query lang or default Configuration lang
+        lang = lang or get_message_lang(message)
         message.context["lang"] = lang
+        if not (self.utterance_plugins.loaded_plugins or
+                self.metadata_plugins.loaded_plugins):
+            # no plugins to run, skip the transform calls entirely
+            return message
+        original = utterances = message.data.get('utterances', [])
         utterances, message.context = self.utterance_plugins.transform(utterances, message.context)
         if original != utterances:
             message.data["utterances"] = utterances
-            LOG.debug(f"utterances transformed: {original} -> {utterances}")
+            # lazy %s formatting, both lists are only repr'd when debug
+            # logging is actually enabled
+            LOG.debug("utterances transformed: %s -> %s",
+                      original, utterances)
         message.context = self.metadata_plugins.transform(message.context)
         return message
 
     @staticmethod
-    def disambiguate_lang(message):
+    def disambiguate_lang(message, default_lang=None):
         """ disambiguate language of the query via pre-defined context keys
         1 - stt_lang -> tagged in stt stage  (STT used this lang to transcribe speech)
         2 - request_lang -> tagged in source message (wake word/request volunteered lang info)
         3 - detected_lang -> tagged by transformers  (text classification, free form chat)
         4 - config lang (or from message.data)
+
+        callers that already resolved the message lang may pass it via
+        default_lang to skip a redundant get_message_lang call
         """
-        cfg = Configuration()
-        default_lang = get_message_lang(message)
-        valid_langs = set([cfg.get("lang", "en-us")] + cfg.get("secondary_langs'", []))
-        lang_keys = ["stt_lang",
-                     "request_lang",
-                     "detected_lang"]
-        for k in lang_keys:
-            if k in message.context:
-                v = message.context[k]
-                if v in valid_langs:
-                    if v != default_lang:
-                        LOG.info(f"replaced {default_lang} with {k}: {v}")
-                    return v
-                else:
-                    LOG.warning(f"ignoring {k}, {v} is not in enabled languages: {valid_langs}")
+        default_lang = default_lang or get_message_lang(message)
+        valid_langs = _get_valid_langs()
+        ctx = message.context
+        for k in _LANG_KEYS:
+            # single dict lookup per key instead of membership + access
+            v = ctx.get(k)
+            if v is None:
+                continue
+            if v in valid_langs:
+                if v != default_lang:
+                    LOG.info(f"replaced {default_lang} with {k}: {v}")
+                return v
+            LOG.warning(f"ignoring {k}, {v} is not in enabled languages: {valid_langs}")
 
         return default_lang
 
@@ -227,55 +385,85 @@ class IntentService:
             message (Message): The messagebus data
         """
         try:
+            # resolve the message lang once, downstream steps reuse it
+            lang = get_message_lang(message)
 
             # Get utterance utterance_plugins additional context
-            message = self._handle_transformers(message)
+            # a broken plugin should not kill intent matching, log and
+            # continue with the raw utterance
+            try:
+                message = self._handle_transformers(message, lang)
+            except Exception:
+                LOG.exception("utterance transformers failed, "
+                              "continuing with raw utterance")
 
             # tag language of this utterance
-            lang = self.disambiguate_lang(message)
+            lang = self.disambiguate_lang(message, default_lang=lang)
             try:
-                setup_locale(lang)
-            except Exception as e:
+                self._set_locale(lang)
+            except Exception:
                 LOG.exception(f"Failed to set lingua_franca default lang to {lang}")
 
             utterances = message.data.get('utterances', [])
 
             stopwatch = Stopwatch()
 
-            # Create matchers
-            padatious_matcher = PadatiousMatcher(self.padatious_service)
-
-            # List of functions to use to match the utterance with intent.
-            # These are listed in priority order.
-            match_funcs = [
-                self.converse.converse_with_skills, padatious_matcher.match_high,
-                self.adapt_service.match_intent, self.common_qa.match,
-                self.fallback.high_prio, padatious_matcher.match_medium,
-                self.fallback.medium_prio, padatious_matcher.match_low,
-                self.fallback.low_prio
-            ]
+            # Reuse the precomputed pipeline, clearing the shared padatious
+            # matcher state left over from the previous utterance
+            if self._padatious_matcher is not None:
+                self._padatious_matcher.reset()
+            match_funcs = self._match_pipeline
 
             # match
             match = None
+            won = None
+            route_key = ((hash(_normalize_utterance(utterances[0])), lang)
+                         if utterances else None)
             with stopwatch:
-                # Loop through the matching functions until a match is found.
-                for match_func in match_funcs:
-                    match = match_func(utterances, lang, message)
-                    if match:
-                        break
+                # active skills always get first refusal via converse
+                match = match_funcs[0](utterances, lang, message)
+                if match:
+                    won = 0
+                else:
+                    # try the matcher that won this exact utterance last
+                    # time before walking the full cascade
+                    hinted = self._match_route.get(route_key)
+                    if hinted is not None:
+                        match = match_funcs[hinted](utterances, lang, message)
+                        if match:
+                            won = hinted
+                if not match:
+                    # Loop through the matching functions until a match
+                    # is found.
+                    for idx, match_func in enumerate(match_funcs[1:], 1):
+                        match = match_func(utterances, lang, message)
+                        if match:
+                            won = idx
+                            break
             if match:
-                if match.skill_id:
-                    self.converse.activate_skill(match.skill_id)
+                # record the winning matcher for repeats, only matchers
+                # without side effects may be replayed out of order
+                if route_key is not None and won in self._pure_matchers:
+                    if len(self._match_route) >= 1024:
+                        self._match_route.clear()
+                    self._match_route[route_key] = won
+                # hoist the field reads to locals, LOAD_FAST is cheaper
+                # than repeated LOAD_ATTR on the hot path
+                skill_id = match.skill_id
+                intent_type = match.intent_type
+                if skill_id:
+                    self.converse.activate_skill(skill_id)
                     # If the service didn't report back the skill_id it
                     # takes on the responsibility of making the skill "active"
 
                 # Launch skill if not handled by the match function
-                if match.intent_type:
+                if intent_type:
                     # keep all original message.data and update with intent
                     # match, mycroft-core only keeps "utterances"
-                    data = dict(message.data)
-                    data.update(match.intent_data)
-                    reply = message.reply(match.intent_type, data)
+                    # single pre-sized dict merge instead of copy + update
+                    reply = message.reply(intent_type,
+                                          {**message.data,
+                                           **match.intent_data})
                     self.bus.emit(reply)
 
             else:
@@ -294,8 +482,10 @@ class IntentService:
         Args:
             message (Message): original message to forward from
         """
-        play_error_sound()
+        # get the failure frame on the wire before spawning the error
+        # sound subprocess
         self.bus.emit(message.forward('complete_intent_failure'))
+        play_error_sound()
 
     def handle_register_vocab(self, message):
         """Register adapt vocabulary.
@@ -316,7 +506,10 @@ class IntentService:
         lang = get_message_lang(message)
         self.adapt_service.register_vocabulary(entity_value, entity_type,
                                                alias_of, regex_str, lang)
-        self.registered_vocab.append(message.data)
+        self._vocab_registry[(lang, entity_type, entity_value,
+                              regex_str, alias_of)] = message.data
+        self._adapt_manifest_cache.clear()
+        self._match_route.clear()
 
     def handle_register_intent(self, message):
         """Register adapt intent.
@@ -326,6 +519,8 @@ class IntentService:
         """
         intent = open_intent_envelope(message)
         self.adapt_service.register_intent(intent)
+        self._adapt_manifest_cache.clear()
+        self._match_route.clear()
 
     def handle_detach_intent(self, message):
         """Remover adapt intent.
@@ -335,6 +530,8 @@ class IntentService:
         """
         intent_name = message.data.get('intent_name')
         self.adapt_service.detach_intent(intent_name)
+        self._adapt_manifest_cache.clear()
+        self._match_route.clear()
 
     def handle_detach_skill(self, message):
         """Remove all intents registered for a specific skill.
@@ -344,6 +541,8 @@ class IntentService:
         """
         skill_id = message.data.get('skill_id')
         self.adapt_service.detach_skill(skill_id)
+        self._adapt_manifest_cache.clear()
+        self._match_route.clear()
 
     def handle_add_context(self, message):
         """Add context
@@ -380,6 +579,16 @@ class IntentService:
         """Clears all keywords from context """
         self.adapt_service.context_manager.clear_context()
 
+    def _reply(self, message, topic, data):
+        """Emit a reply to a query message in a single helper call.
+
+        Args:
+            message (Message): query message to reply to
+            topic (str): reply message type
+            data (dict): reply payload
+        """
+        self.bus.emit(message.reply(topic, data))
+
     def handle_get_intent(self, message):
         """Get intent from either adapt or padatious.
 
@@ -389,22 +598,11 @@ class IntentService:
         utterance = message.data["utterance"]
         lang = get_message_lang(message)
 
-        # Create matchers
-        padatious_matcher = PadatiousMatcher(self.padatious_service)
-
-        # List of functions to use to match the utterance with intent.
-        # These are listed in priority order.
-        # TODO once we have a mechanism for checking if a fallback will
-        #  trigger without actually triggering it, those should be added here
-        match_funcs = [
-            padatious_matcher.match_high,
-            self.adapt_service.match_intent,
-            # self.fallback.high_prio,
-            padatious_matcher.match_medium,
-            # self.fallback.medium_prio,
-            padatious_matcher.match_low,
-            # self.fallback.low_prio
-        ]
+        # Reuse the precomputed pipeline, clearing the shared padatious
+        # matcher state left over from the previous query
+        if self._padatious_matcher is not None:
+            self._padatious_matcher.reset()
+        match_funcs = self._intent_api_pipeline
         # Loop through the matching functions until a match is found.
         for match_func in match_funcs:
             match = match_func([utterance], lang, message)
@@ -415,13 +613,12 @@ class IntentService:
                     intent_data["intent_service"] = match.intent_service
                     intent_data["skill_id"] = match.skill_id
                     intent_data["handler"] = match_func.__name__
-                    self.bus.emit(message.reply("intent.service.intent.reply",
-                                                {"intent": intent_data}))
+                    self._reply(message, "intent.service.intent.reply",
+                                {"intent": intent_data})
                 return
 
         # signal intent failure
-        self.bus.emit(message.reply("intent.service.intent.reply",
-                                    {"intent": None}))
+        self._reply(message, "intent.service.intent.reply", {"intent": None})
 
     def handle_get_skills(self, message):
         """Send registered skills to caller.
@@ -429,8 +626,8 @@ class IntentService:
         Argument:
             message: query message to reply to.
         """
-        self.bus.emit(message.reply("intent.service.skills.reply",
-                                    {"skills": self.skill_names}))
+        self._reply(message, "intent.service.skills.reply",
+                    {"skills": self.skill_names})
 
     def handle_get_active_skills(self, message):
         """Send active skills to caller.
@@ -438,8 +635,8 @@ class IntentService:
         Argument:
             message: query message to reply to.
         """
-        self.bus.emit(message.reply("intent.service.active_skills.reply",
-                                    {"skills": self.converse.active_skills}))
+        self._reply(message, "intent.service.active_skills.reply",
+                    {"skills": self.converse.active_skills})
 
     def handle_get_adapt(self, message):
         """handler getting the adapt response for an utterance.
@@ -451,8 +648,8 @@ class IntentService:
         lang = get_message_lang(message)
         intent = self.adapt_service.match_intent([utterance], lang)
         intent_data = intent.intent_data if intent else None
-        self.bus.emit(message.reply("intent.service.adapt.reply",
-                                    {"intent": intent_data}))
+        self._reply(message, "intent.service.adapt.reply",
+                    {"intent": intent_data})
 
     def handle_adapt_manifest(self, message):
         """Send adapt intent manifest to caller.
@@ -460,8 +657,8 @@ class IntentService:
         Argument:
             message: query message to reply to.
         """
-        self.bus.emit(message.reply("intent.service.adapt.manifest",
-                                    {"intents": self.registered_intents}))
+        self._reply(message, "intent.service.adapt.manifest",
+                    {"intents": self.registered_intents})
 
     def handle_vocab_manifest(self, message):
         """Send adapt vocabulary manifest to caller.
@@ -469,8 +666,8 @@ class IntentService:
         Argument:
             message: query message to reply to.
         """
-        self.bus.emit(message.reply("intent.service.adapt.vocab.manifest",
-                                    {"vocab": self.registered_vocab}))
+        self._reply(message, "intent.service.adapt.vocab.manifest",
+                    {"vocab": self.registered_vocab})
 
     def handle_get_padatious(self, message):
         """messagebus handler for perfoming padatious parsing.
@@ -480,13 +677,17 @@ class IntentService:
         """
         utterance = message.data["utterance"]
         norm = message.data.get('norm_utt', utterance)
-        intent = self.padatious_service.calc_intent(utterance)
-        if not intent and norm != utterance:
-            intent = self.padatious_service.calc_intent(norm)
+        if norm == utterance:
+            intent = self.padatious_service.calc_intent(utterance)
+        else:
+            # resolve both variants in a single batched call instead of
+            # two sequential inference passes, best confidence wins
+            intent = self.padatious_service.threaded_calc_intent(
+                [utterance, norm])
         if intent:
             intent = intent.__dict__
-        self.bus.emit(message.reply("intent.service.padatious.reply",
-                                    {"intent": intent}))
+        self._reply(message, "intent.service.padatious.reply",
+                    {"intent": intent})
 
     def handle_padatious_manifest(self, message):
         """Messagebus handler returning the registered padatious intents.
@@ -494,9 +695,8 @@ class IntentService:
         Args:
             message (Message): message triggering the method
         """
-        self.bus.emit(message.reply(
-            "intent.service.padatious.manifest",
-            {"intents": self.padatious_service.registered_intents}))
+        self._reply(message, "intent.service.padatious.manifest",
+                    {"intents": self.padatious_service.registered_intents})
 
     def handle_entity_manifest(self, message):
         """Messagebus handler returning the registered padatious entities.
@@ -504,9 +704,8 @@ class IntentService:
         Args:
             message (Message): message triggering the method
         """
-        self.bus.emit(message.reply(
-            "intent.service.padatious.entities.manifest",
-            {"entities": self.padatious_service.registered_entities}))
+        self._reply(message, "intent.service.padatious.entities.manifest",
+                    {"entities": self.padatious_service.registered_entities})
 
 
 def _is_old_style_keyword_message(message):
@@ -14,9 +14,13 @@
 #
 """Intent service for Mycroft's fallback system."""
 import operator
+import uuid
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from threading import Event, Lock
 
-import time
+from ovos_bus_client.message import Message
 from ovos_config import Configuration
 
 import ovos_core.intent_services
@@ -34,8 +38,42 @@ class FallbackService:
         self.bus = bus
         self.fallback_config = Configuration()["skills"].get("fallbacks", {})
         self.registered_fallbacks = {}  # skill_id: priority
+        # skill_id: (request_topic, response_topic), built at registration
+        # so dispatch does not format topic strings per attempt
+        self._fallback_topics = {}
+        # (skill_id, priority) sorted by priority, rebuilt lazily after
+        # register/deregister so utterance handling never re-sorts
+        self._sorted_fallbacks = None
+        # last collected candidate set, shared by the three priority tiers
+        # so one utterance costs a single ping/pong roundtrip
+        self._collect_cache = None
+        self._registry_version = 0  # bumped on register/deregister
+        self._load_fallback_config()
         self.bus.on("ovos.skills.fallback.register", self.handle_register_fallback)
         self.bus.on("ovos.skills.fallback.deregister", self.handle_deregister_fallback)
+        self.bus.on("configuration.updated", self._handle_config_update)
+        self.bus.on("configuration.patch", self._handle_config_update)
+
+    def _load_fallback_config(self):
+        """Snapshot the fallback mode and black/whitelists.
+
+        _fallback_allowed runs per skill per utterance; frozensets make
+        the membership tests O(1) instead of scanning the config lists.
+        """
+        self._opmode = self.fallback_config.get("fallback_mode",
+                                                FallbackMode.ACCEPT_ALL)
+        self._blacklist = frozenset(
+            self.fallback_config.get("fallback_blacklist") or [])
+        self._whitelist = frozenset(
+            self.fallback_config.get("fallback_whitelist") or [])
+        # deprecated FallbackSkillsV1 support, opt-in because the blocking
+        # wait costs up to v1_timeout seconds per tier when nothing answers
+        self._v1_compat = self.fallback_config.get("v1_compat", False)
+        self._v1_timeout = self.fallback_config.get("v1_timeout", 2)
+
+    def _handle_config_update(self, message):
+        self.fallback_config = Configuration()["skills"].get("fallbacks", {})
+        self._load_fallback_config()
 
     def handle_register_fallback(self, message):
         skill_id = message.data.get("skill_id")
@@ -49,11 +87,30 @@ class FallbackService:
             self.registered_fallbacks[skill_id] = new_priority
         else:
             self.registered_fallbacks[skill_id] = priority
+        self._fallback_topics[skill_id] = (
+            f"ovos.skills.fallback.{skill_id}.request",
+            f"ovos.skills.fallback.{skill_id}.response")
+        self._sorted_fallbacks = None
+        self._registry_version += 1
 
     def handle_deregister_fallback(self, message):
         skill_id = message.data.get("skill_id")
-        if skill_id in self.registered_fallbacks:
-            self.registered_fallbacks.pop(skill_id)
+        # single hash lookup instead of a containment check plus pop
+        if self.registered_fallbacks.pop(skill_id, None) is not None:
+            self._fallback_topics.pop(skill_id, None)
+            self._sorted_fallbacks = None
+            self._registry_version += 1
+
+    def _get_sorted_fallbacks(self):
+        """(skill_id, priority) pairs sorted by priority.
+
+        Sorting happens at most once per register/deregister instead of
+        on every utterance.
+        """
+        if self._sorted_fallbacks is None:
+            self._sorted_fallbacks = sorted(self.registered_fallbacks.items(),
+                                            key=operator.itemgetter(1))
+        return self._sorted_fallbacks
 
     def _fallback_allowed(self, skill_id):
         """Checks if a skill_id is allowed to fallback
@@ -67,27 +124,39 @@ class FallbackService:
         Returns:
             permitted (bool): True if skill can fallback
         """
-        opmode = self.fallback_config.get("fallback_mode", FallbackMode.ACCEPT_ALL)
-        if opmode == FallbackMode.BLACKLIST and skill_id in \
-                self.fallback_config.get("fallback_blacklist", []):
+        opmode = self._opmode
+        if opmode == FallbackMode.BLACKLIST and skill_id in self._blacklist:
             return False
-        elif opmode == FallbackMode.WHITELIST and skill_id not in \
-                self.fallback_config.get("fallback_whitelist", []):
+        elif opmode == FallbackMode.WHITELIST and \
+                skill_id not in self._whitelist:
             return False
         return True
 
     def _collect_fallback_skills(self, message, fb_range=FallbackRange(0, 100)):
         """use the messagebus api to determine which skills have registered fallback handlers
         This includes all skills and external applications"""
-        skill_ids = []  # skill_ids that already answered to ping
+        if not self.registered_fallbacks:
+            # no-one to ping, skip the bus roundtrip and its 500ms budget
+            return []
+        skill_ids = set()  # skill_ids that already answered to ping
         fallback_skills = []  # skill_ids that want to handle fallback
 
         # filter skills outside the fallback_range
         in_range = [s for s, p in self.registered_fallbacks.items()
                     if fb_range.start < p <= fb_range.stop]
-        skill_ids += [s for s in self.registered_fallbacks if s not in in_range]
+        skill_ids.update(s for s in self.registered_fallbacks
+                         if s not in in_range)
+
+        all_acked = Event()  # set once every registered skill answered
+        ack_lock = Lock()  # pong handlers run on the bus worker thread
+        # ties pongs to this ping, skills reply() so the context round-trips
+        nonce = uuid.uuid4().hex
 
         def handle_ack(msg):
+            if msg.context.get("_fb_nonce") != nonce:
+                # stale ack from an earlier collect that timed out, or a
+                # concurrent utterance - not ours
+                return
             skill_id = msg.data["skill_id"]
             if msg.data.get("can_handle", True):
                 if skill_id in self.registered_fallbacks:
@@ -95,21 +164,50 @@ class FallbackService:
                 LOG.info(f"{skill_id} will try to handle fallback")
             else:
                 LOG.info(f"{skill_id} will NOT try to handle fallback")
-            skill_ids.append(skill_id)
+            with ack_lock:
+                skill_ids.add(skill_id)
+                if all(s in skill_ids for s in self.registered_fallbacks):
+                    all_acked.set()
 
         self.bus.on("ovos.skills.fallback.pong", handle_ack)
+        try:
+            LOG.info("checking for FallbackSkillsV2 candidates")
+            # wait for all skills to acknowledge they want to answer
+            # fallback queries, returning as soon as the last ack arrives
+            # forward() shares the context dict by reference, so the nonce
+            # goes into an explicit copy instead of leaking into every
+            # later reply built from the utterance message
+            ping = Message("ovos.skills.fallback.ping", message.data,
+                           context={**message.context, "_fb_nonce": nonce})
+            self.bus.emit(ping)
+            all_acked.wait(timeout=0.5)
+        finally:
+            # always detach, a leaked handler would process every future
+            # ping on top of the fresh one registered for it
+            self.bus.remove("ovos.skills.fallback.pong", handle_ack)
+        return fallback_skills
 
-        LOG.info("checking for FallbackSkillsV2 candidates")
-        # wait for all skills to acknowledge they want to answer fallback queries
-        self.bus.emit(message.forward("ovos.skills.fallback.ping",
-                                      message.data))
-        start = time.time()
-        while not all(s in skill_ids for s in self.registered_fallbacks) \
-                and time.time() - start <= 0.5:
-            time.sleep(0.02)
+    def _collect_cached(self, message, utterances):
+        """Collect fallback candidates once per utterance.
 
-        self.bus.remove("ovos.skills.fallback.pong", handle_ack)
-        return fallback_skills
+        high_prio, medium_prio and low_prio each need the candidate set;
+        answering the ping does not depend on the priority range, so the
+        full-range result is collected on the first tier and reused by
+        the later ones. The cache is keyed on session, utterances and the
+        registry version so register/deregister invalidate it.
+
+        Returns:
+            set: skill_ids that want to handle the utterance
+        """
+        key = (message.context.get("session_id"), tuple(utterances),
+               self._registry_version)
+        cached = self._collect_cache
+        if cached and cached[0] == key:
+            return cached[1]
+        candidates = set(self._collect_fallback_skills(
+            message, FallbackRange(0, 101)))
+        self._collect_cache = (key, candidates)
+        return candidates
 
     def attempt_fallback(self, utterances, skill_id, lang, message):
         """Call skill and ask if they want to process the utterance.
@@ -125,13 +223,15 @@ class FallbackService:
             handled (bool): True if handled otherwise False.
         """
         if self._fallback_allowed(skill_id):
-            fb_msg = message.reply(f"ovos.skills.fallback.{skill_id}.request",
+            req_topic, resp_topic = self._fallback_topics.get(skill_id) or (
+                f"ovos.skills.fallback.{skill_id}.request",
+                f"ovos.skills.fallback.{skill_id}.response")
+            fb_msg = message.reply(req_topic,
                                    {"skill_id": skill_id,
                                     "utterances": utterances,
                                     "utterance": utterances[0],  # backwards compat, we send all transcripts now
                                     "lang": lang})
-            result = self.bus.wait_for_response(fb_msg,
-                                                f"ovos.skills.fallback.{skill_id}.response")
+            result = self.bus.wait_for_response(fb_msg, resp_topic)
             if result and 'error' in result.data:
                 error_msg = result.data['error']
                 LOG.error(f"{skill_id}: {error_msg}")
@@ -140,6 +240,67 @@ class FallbackService:
                 return result.data.get('result', False)
         return False
 
+    def _attempt_prio_bucket(self, skills, utterances, lang, message):
+        """Query all skills sharing a priority level concurrently.
+
+        Skills with the same priority have no defined ordering between
+        them, so their attempts can overlap - worst case latency for the
+        bucket drops from the sum of the per-skill timeouts to the max.
+
+        Trade-off: every skill in the bucket runs its handler to
+        completion; unlike the old serial loop, a second skill that can
+        also handle the utterance is no longer skipped once the first
+        reports success (running handlers cannot be cancelled).
+
+        Args:
+            skills (list): skill_ids sharing one priority level
+            utterances (list): utterances to hand to the skills
+            lang (str): current language
+            message (Message): message containing interaction info.
+
+        Returns:
+            handled (bool): True if any skill handled the utterance
+        """
+        if len(skills) == 1:  # nothing to overlap, skip the executor
+            return self.attempt_fallback(utterances, skills[0], lang, message)
+        with ThreadPoolExecutor(max_workers=len(skills)) as executor:
+            futures = [executor.submit(self.attempt_fallback, utterances,
+                                       skill_id, lang, message)
+                       for skill_id in skills]
+            handled = False
+            for future in as_completed(futures):
+                if future.result():
+                    handled = True
+                    break
+        return handled
+
+    def _prepare(self, utterances, lang, message):
+        """Flatten utterances and prime message.data once per utterance.
+
+        high_prio, medium_prio and low_prio each run through
+        _fallback_range for the same utterance; the flatten and the
+        message.data mutations are idempotent, so only the first tier
+        pays for them.
+
+        Returns:
+            list: flat list of utterance transcripts
+        """
+        # the marker lives on the message itself - an id()-keyed cache
+        # can false-hit when CPython recycles the address of a collected
+        # message for a new one carrying the same utterance
+        key = (tuple(utterances), lang)
+        if message.context.get("_fb_prepared") == key:
+            return message.data["utterances"]
+        # we call flatten in case someone is sending the old style list of
+        # tuples, modern callers already pass a flat list of strings so the
+        # common case skips the recursive copy
+        if utterances and not isinstance(utterances[0], str):
+            utterances = flatten_list(utterances)
+        message.data["utterances"] = utterances  # all transcripts
+        message.data["lang"] = lang
+        message.context["_fb_prepared"] = key
+        return utterances
+
     def _fallback_range(self, utterances, lang, message, fb_range):
         """Send fallback request for a specified priority range.
 
@@ -153,32 +314,43 @@ class FallbackService:
         Returns:
             IntentMatch or None
         """
-        # we call flatten in case someone is sending the old style list of tuples
-        utterances = flatten_list(utterances)
-        message.data["utterances"] = utterances  # all transcripts
-        message.data["lang"] = lang
+        utterances = self._prepare(utterances, lang, message)
 
         # new style bus api
-        fallbacks = [(k, v) for k, v in self.registered_fallbacks.items()
-                     if k in self._collect_fallback_skills(message, fb_range)]
-        sorted_handlers = sorted(fallbacks, key=operator.itemgetter(1))
-        for skill_id, prio in sorted_handlers:
-            result = self.attempt_fallback(utterances, skill_id, lang, message)
-            if result:
-                return ovos_core.intent_services.IntentMatch('Fallback', None, {}, None)
+        # only ping if some registered skill actually falls in range,
+        # otherwise go straight to the deprecated v1 check
+        in_range = [(k, v) for k, v in self._get_sorted_fallbacks()
+                    if fb_range.start < v <= fb_range.stop]
+        if in_range:
+            candidates = self._collect_cached(message, utterances)
+            # in_range is already priority-sorted, filtering preserves order
+            sorted_handlers = [(k, v) for k, v in in_range if k in candidates]
+            # query equal priority skills concurrently, each attempt blocks
+            # on a bus response so threads overlap the wait. priority order
+            # is still honoured across buckets
+            for prio, bucket in groupby(sorted_handlers,
+                                        key=operator.itemgetter(1)):
+                skills = [skill_id for skill_id, _ in bucket]
+                if self._attempt_prio_bucket(skills, utterances, lang,
+                                             message):
+                    return ovos_core.intent_services.IntentMatch('Fallback', None, {}, None)
 
-        # old style deprecated fallback skill singleton class
-        LOG.debug("checking for FallbackSkillsV1")
-        msg = message.reply(
-            'mycroft.skills.fallback',
-            data={'utterance': utterances[0],
-                  'lang': lang,
-                  'fallback_range': (fb_range.start, fb_range.stop)}
-        )
-        response = self.bus.wait_for_response(msg, timeout=10)
-
-        if response and response.data['handled']:
-            return ovos_core.intent_services.IntentMatch('Fallback', None, {}, None)
+        # old style deprecated fallback skill singleton class, opt-in via
+        # config since it blocks every unhandled tier waiting for skills
+        # that modern deployments no longer ship
+        if self._v1_compat:
+            LOG.debug("checking for FallbackSkillsV1")
+            msg = message.reply(
+                'mycroft.skills.fallback',
+                data={'utterance': utterances[0],
+                      'lang': lang,
+                      'fallback_range': (fb_range.start, fb_range.stop)}
+            )
+            response = self.bus.wait_for_response(msg,
+                                                  timeout=self._v1_timeout)
+
+            if response and response.data['handled']:
+                return ovos_core.intent_services.IntentMatch('Fallback', None, {}, None)
         return None
 
     def high_prio(self, utterances, lang, message):
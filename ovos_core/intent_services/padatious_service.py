@@ -17,7 +17,7 @@ from multiprocessing import Pool
 from os import path
 from os.path import expanduser, isfile
 from subprocess import call
-from threading import Event
+from threading import Event, local
 from typing import List, Optional, Tuple
 
 from ovos_bus_client.message import Message
@@ -67,14 +67,47 @@ except ImportError:
 
 
 class PadatiousMatcher:
-    """Matcher class to avoid redundancy in padatious intent matching."""
+    """Matcher class to avoid redundancy in padatious intent matching.
+
+    A single instance can be shared across utterances and threads, the
+    per-utterance match cache lives in thread-local storage and is
+    cleared with reset() before handling a new utterance.
+    """
 
     def __init__(self, service):
         self.service = service
+        self._state = local()
+        self.reset()
+
+    def reset(self):
+        """Clear the cached match so the matcher can serve a new utterance."""
+        self._state.has_result = False
+        self._state.ret = None
+        self._state.conf = None
+
+    @property
+    def has_result(self):
+        return getattr(self._state, 'has_result', False)
+
+    @has_result.setter
+    def has_result(self, val):
+        self._state.has_result = val
+
+    @property
+    def ret(self):
+        return getattr(self._state, 'ret', None)
+
+    @ret.setter
+    def ret(self, val):
+        self._state.ret = val
+
+    @property
+    def conf(self):
+        return getattr(self._state, 'conf', None)
 
-        self.has_result = False
-        self.ret = None
-        self.conf = None
+    @conf.setter
+    def conf(self, val):
+        self._state.conf = val
 
     def _match_level(self, utterances, limit, lang=None):
         """Match intent and make sure a certain level of confidence is reached.
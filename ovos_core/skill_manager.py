@@ -14,9 +14,11 @@
 #
 """Load, update and manage skills on this device."""
 import os
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from itertools import chain
 from os.path import basename
-from threading import Thread, Event, Lock
+from sys import intern
+from threading import Thread, Event, Lock, Timer
 from time import sleep, monotonic
 
 from ovos_backend_client.pairing import is_paired
@@ -25,6 +27,7 @@ from ovos_bus_client.message import Message
 from ovos_config.config import Configuration
 from ovos_config.locations import get_xdg_config_save_path
 from ovos_plugin_manager.skills import find_skill_plugins
+from ovos_plugin_manager.utils import PluginTypes
 from ovos_utils.enclosure.api import EnclosureAPI
 from ovos_utils.file_utils import FileWatcher
 from ovos_utils.gui import is_gui_connected
@@ -35,6 +38,32 @@ from ovos_utils.skills.locations import get_skill_directories
 from ovos_workshop.skill_launcher import SKILL_MAIN_MODULE
 from ovos_workshop.skill_launcher import SkillLoader, PluginSkillLoader
 
+try:
+    from importlib.metadata import entry_points
+except ImportError:  # python < 3.8
+    try:
+        from importlib_metadata import entry_points
+    except ImportError:
+        entry_points = None
+
+
+def _plugin_fingerprint():
+    """Cheap fingerprint of the installed skill plugin entry points.
+
+    Listing entry point names is much cheaper than find_skill_plugins,
+    which imports every plugin module; the fingerprint only changes when
+    plugins are installed or removed.
+    """
+    if entry_points is None:
+        # no way to take a cheap fingerprint, return a value that never
+        # matches the cached one so every pass rescans like it used to
+        return object()
+    try:
+        eps = entry_points(group=PluginTypes.SKILL)
+    except TypeError:  # python < 3.10
+        eps = entry_points().get(PluginTypes.SKILL, [])
+    return tuple(sorted(ep.name for ep in eps))
+
 
 def _shutdown_skill(instance):
     """Shutdown a skill.
@@ -77,6 +106,15 @@ def on_stopping():
     LOG.info('Skills Manager is shutting down...')
 
 
+# service groups handled specially by check_services_ready, module level
+# so the per-service loop does not rebuild a list every iteration
+_SETUP_SERVICES = frozenset(("pairing", "setup"))
+_NOOP_SERVICES = frozenset(("gui", "enclosure"))  # not implemented
+
+# give misbehaving skills this long to shut down before moving on
+_SHUTDOWN_TIMEOUT = 30
+
+
 class SkillManager(Thread):
 
     def __init__(self, bus, watchdog=None, alive_hook=on_alive, started_hook=on_started, ready_hook=on_ready,
@@ -90,8 +128,16 @@ class SkillManager(Thread):
         super(SkillManager, self).__init__()
         self.bus = bus
         self._settings_watchdog = None
+        self._skills_watchdog = None
+        # per-skill debounce state for settings file events, an editor
+        # save or git pull fires several FS events per file
+        self._pending_settings = {}  # skill_id: (Timer, first event time)
+        self._settings_lock = Lock()
         # Set watchdog to argument or function returning None
         self._watchdog = watchdog or (lambda: None)
+        # a real watchdog needs feeding at the old 2 second cadence, the
+        # scan loop only idles longer when there is none
+        self._has_watchdog = watchdog is not None
         callbacks = StatusCallbackMap(on_started=started_hook,
                                       on_alive=alive_hook,
                                       on_ready=ready_hook,
@@ -102,19 +148,59 @@ class SkillManager(Thread):
 
         self._lock = Lock()
         self._setup_event = Event()
+        self._setup_finished = Event()
         self._stop_event = Event()
+        self._rescan_event = Event()  # wakes the scan loop early
         self._connected_event = Event()
         self._network_event = Event()
         self._gui_event = Event()
+        self._gui_probed = False  # one-time is_gui_connected fallback used
         self._network_loaded = Event()
         self._internet_loaded = Event()
+        self._training_complete = Event()
+        # per-service ready Events, registered lazily so only services
+        # listed in ready_settings get a bus subscription
+        self._service_ready_events = {}
+        self._any_service_ready = Event()
         self._network_skill_timeout = 300
         self._allow_state_reloads = True
 
         self.config = Configuration()
+        # hoisted config values used by the readiness polling loops,
+        # refreshed on the configuration change events
+        self._load_config_values()
 
         self.skill_loaders = {}
         self.plugin_skills = {}
+        # skill_id: loader index over both dicts above, skill_loaders is
+        # keyed by directory so id lookups would otherwise be linear scans
+        self._by_skill_id = {}
+        # skill_id: skill_dir for loaded local skills, used to detect a
+        # same-id skill appearing in a higher priority directory
+        self._loaded_skill_dirs = {}
+        self._loading = set()  # skill dirs with a load in flight
+        # skill_dir: (main module mtime, RuntimeRequirements), probing
+        # requirements may import the skill module so do it at most once
+        self._req_cache = {}
+        # plugin discovery cache, refreshed only when the entry point
+        # fingerprint changes or a rescan is requested over the bus
+        self._plugin_cache = None
+        self._plugin_cache_stamp = None
+        # skill_id: RuntimeRequirements for not-yet-loaded plugins, the
+        # probe loader only needs to be built once per plugin
+        self._plugin_reqs = {}
+        # inputs of the last load_plugin_skills pass, identical inputs
+        # mean identical decisions so the pass can be skipped outright
+        self._last_plugin_scan = None
+        # skill directory scan cache, valid while the watched directory
+        # mtimes are unchanged
+        self._skill_dir_cache = None
+        self._skill_dir_mtimes = None
+        self._skill_dir_roots = None
+        # skill_dir <-> skill_id maps from the last scan, the basename
+        # is computed once per rebuild instead of per consumer loop
+        self._skill_dir_map = {}  # skill_dir: skill_id
+        self._skill_id_map = {}  # skill_id: skill_dir
         self.enclosure = EnclosureAPI(bus)
         self.initial_load_complete = False
         self.num_install_retries = 0
@@ -126,6 +212,14 @@ class SkillManager(Thread):
         self.status.bind(self.bus)
         self._init_filewatcher()
 
+    def _load_config_values(self):
+        self._backend_type = self.config.get(
+            "server", {}).get("backend_type", "offline")
+        self._ready_settings = self.config.get("ready_settings") or ["skills"]
+
+    def _handle_config_update(self, message):
+        self._load_config_values()
+
     def _init_filewatcher(self):
         # monitor skill settings files for changes
         sspath = f"{get_xdg_config_save_path()}/skills/"
@@ -135,12 +229,53 @@ class SkillManager(Thread):
                                               recursive=True,
                                               ignore_creation=True)
 
+    def _init_skills_watchdog(self):
+        # monitor the skill directories so the scan loop only runs when
+        # something actually changed on disk
+        try:
+            self._skills_watchdog = FileWatcher(
+                get_skill_directories(),
+                callback=self._handle_skill_dir_change,
+                recursive=True)
+        except Exception:
+            LOG.exception("Failed to watch skill directories, "
+                          "relying on the periodic safety rescan")
+
+    def _handle_skill_dir_change(self, path: str):
+        self._rescan_event.set()
+
+    # coalesce FS events arriving within this window into one bus message
+    _SETTINGS_DEBOUNCE = 0.2
+    # but never delay a change notification longer than this
+    _SETTINGS_MAX_DELAY = 1.0
+
     def _handle_settings_file_change(self, path: str):
-        if path.endswith("/settings.json"):
-            skill_id = path.split("/")[-2]
-            LOG.info(f"skill settings.json change detected for {skill_id}")
-            self.bus.emit(Message("ovos.skills.settings_changed",
-                                  {"skill_id": skill_id}))
+        if os.path.basename(path) == "settings.json":
+            skill_id = os.path.basename(os.path.dirname(path))
+            with self._settings_lock:
+                pending = self._pending_settings.get(skill_id)
+                if pending:
+                    timer, first_event = pending
+                    if monotonic() - first_event + self._SETTINGS_DEBOUNCE \
+                            >= self._SETTINGS_MAX_DELAY:
+                        # a constant stream of writes must still flush, let
+                        # the already scheduled timer fire
+                        return
+                    timer.cancel()
+                else:
+                    first_event = monotonic()
+                timer = Timer(self._SETTINGS_DEBOUNCE,
+                              self._flush_settings_change, args=(skill_id,))
+                timer.daemon = True
+                self._pending_settings[skill_id] = (timer, first_event)
+                timer.start()
+
+    def _flush_settings_change(self, skill_id):
+        with self._settings_lock:
+            self._pending_settings.pop(skill_id, None)
+        LOG.info(f"skill settings.json change detected for {skill_id}")
+        self.bus.emit(Message("ovos.skills.settings_changed",
+                              {"skill_id": skill_id}))
 
     def _sync_skill_loading_state(self):
         resp = self.bus.wait_for_response(Message("ovos.PHAL.internet_check"))
@@ -172,9 +307,17 @@ class SkillManager(Thread):
         self.bus.on('skillmanager.deactivate', self.deactivate_skill)
         self.bus.on('skillmanager.keep', self.deactivate_except)
         self.bus.on('skillmanager.activate', self.activate_skill)
+        self.bus.on('ovos.skills.plugins.rescan', self.handle_plugin_rescan)
+        self.bus.on('configuration.updated', self._handle_config_update)
+        self.bus.on('configuration.patch', self._handle_config_update)
         self.bus.once('mycroft.skills.initialized',
                       self.handle_check_device_readiness)
         self.bus.once('mycroft.skills.trained', self.handle_initial_training)
+        # registered once here, check_services_ready used to attach a new
+        # one-shot handler on every poll which leaked handlers and mutated
+        # its loop state from the bus thread
+        self.bus.once('ovos.setup.finished',
+                      lambda m: self._setup_finished.set())
 
         # load skills waiting for connectivity
         self.bus.on("mycroft.network.connected", self.handle_network_connected)
@@ -184,6 +327,24 @@ class SkillManager(Thread):
         self.bus.on("mycroft.internet.disconnected", self.handle_internet_disconnected)
         self.bus.on("mycroft.gui.unavailable", self.handle_gui_disconnected)
 
+    def _service_ready_event(self, ser):
+        """Event set when a service announces itself ready over the bus.
+
+        Subscribing once per service replaces repeated is_ready bus
+        round-trips; the shared _any_service_ready event wakes the
+        readiness loop as soon as anything reports in.
+        """
+        event = self._service_ready_events.get(ser)
+        if event is None:
+            event = self._service_ready_events[ser] = Event()
+
+            def _on_ready(message, _event=event):
+                _event.set()
+                self._any_service_ready.set()
+
+            self.bus.on(f"mycroft.{ser}.ready", _on_ready)
+        return event
+
     def is_device_ready(self):
         is_ready = False
         # different setups will have different needs
@@ -195,8 +356,7 @@ class SkillManager(Thread):
         # audio -> audio playback reported ready
         # gui -> gui websocket reported ready - NOT IMPLEMENTED
         # enclosure -> enclosure/HAL reported ready - NOT IMPLEMENTED
-        services = {k: False for k in
-                    self.config.get("ready_settings", ["skills"])}
+        services = {k: False for k in self._ready_settings}
         start = monotonic()
         while not is_ready:
             is_ready = self.check_services_ready(services)
@@ -206,7 +366,10 @@ class SkillManager(Thread):
                 raise TimeoutError(
                     f'Timeout waiting for services start. services={services}')
             else:
-                sleep(3)
+                # re-check as soon as any service reports ready instead of
+                # always paying the full poll interval
+                self._any_service_ready.wait(3)
+                self._any_service_ready.clear()
         return is_ready
 
     def handle_check_device_readiness(self, message):
@@ -227,19 +390,15 @@ class SkillManager(Thread):
 
         services (iterable): service names to check.
         """
-        backend_type = self.config.get("server", {}).get("backend_type", "offline")
         for ser, rdy in services.items():
             if rdy:
                 # already reported ready
                 continue
-            if ser in ["pairing", "setup"]:
-
-                def setup_finish_interrupt(message):
-                    nonlocal services
+            if ser in _SETUP_SERVICES:
+                # if setup finished naturally be ready early
+                if self._setup_finished.is_set():
                     services[ser] = True
-
-                # if setup finishes naturally be ready early
-                self.bus.once("ovos.setup.finished", setup_finish_interrupt)
+                    continue
 
                 # pairing service (setup skill) needs to be available
                 # in offline mode (default) is_paired always returns True
@@ -255,28 +414,32 @@ class SkillManager(Thread):
                     LOG.debug(f"Setup state: {state}")
                     if state == "finished":
                         services[ser] = True
-                elif not services[ser] and backend_type == "selene":
+                elif not services[ser] and self._backend_type == "selene":
                     # older verson / alternate setup skill installed
                     services[ser] = is_paired(ignore_errors=True)
-            elif ser in ["gui", "enclosure"]:
+            elif ser in _NOOP_SERVICES:
                 # not implemented
                 services[ser] = True
                 continue
-            elif ser in ["skills"]:
+            elif ser == "skills":
                 services[ser] = self.status.check_ready()
                 continue
-            elif ser in ["network_skills"]:
+            elif ser == "network_skills":
                 services[ser] = self._network_loaded.is_set()
                 continue
-            elif ser in ["internet_skills"]:
+            elif ser == "internet_skills":
                 services[ser] = self._internet_loaded.is_set()
                 continue
+            if self._service_ready_event(ser).is_set():
+                # service announced itself ready, skip the bus round-trip
+                services[ser] = True
+                continue
             response = self.bus.wait_for_response(
                 Message(f'mycroft.{ser}.is_ready',
                         context={"source": "skills", "destination": ser}))
             if response and response.data['status']:
                 services[ser] = True
-        return all([services[ser] for ser in services])
+        return all(services.values())
 
     @property
     def skills_config(self):
@@ -318,22 +481,55 @@ class SkillManager(Thread):
             self._network_event.set()
             self._load_on_network()
 
+    def handle_plugin_rescan(self, message):
+        """Drop the plugin discovery cache, forcing a rescan on next load."""
+        self._plugin_cache = None
+        self._plugin_cache_stamp = None
+        self._plugin_reqs = {}
+        self._last_plugin_scan = None
+
+    def _discover_plugins(self):
+        """Find skill plugins, re-scanning only when the installed set changed.
+
+        find_skill_plugins imports every plugin entry point, which is far
+        too expensive to repeat on every pass through the main loop.
+        """
+        stamp = _plugin_fingerprint()
+        if self._plugin_cache is None or stamp != self._plugin_cache_stamp:
+            self._plugin_cache = find_skill_plugins()
+            self._plugin_cache_stamp = stamp
+        return self._plugin_cache
+
     def load_plugin_skills(self, network=None, internet=None):
         if network is None:
             network = self._network_event.is_set()
         if internet is None:
             internet = self._connected_event.is_set()
-        plugins = find_skill_plugins()
-        loaded_skill_ids = [basename(p) for p in self.skill_loaders]
+        plugins = self._discover_plugins()
+        loaded_skill_ids = frozenset(basename(p) for p in self.skill_loaders)
+        # snapshot so membership checks are O(1) and unaffected by loads
+        # happening on other threads while we iterate
+        plugin_skill_ids = frozenset(self.plugin_skills)
+        # the decision only depends on these inputs, skip the pass when
+        # none of them changed since the last one
+        scan_state = (self._plugin_cache_stamp, network, internet,
+                      plugin_skill_ids, loaded_skill_ids)
+        if scan_state == self._last_plugin_scan:
+            return
         for skill_id, plug in plugins.items():
-            if skill_id not in self.plugin_skills and skill_id not in loaded_skill_ids:
-                skill_loader = self._get_plugin_skill_loader(skill_id, init_bus=False)
-                requirements = skill_loader.runtime_requirements
+            if skill_id not in plugin_skill_ids and skill_id not in loaded_skill_ids:
+                requirements = self._plugin_reqs.get(skill_id)
+                if requirements is None:
+                    skill_loader = self._get_plugin_skill_loader(
+                        skill_id, init_bus=False)
+                    requirements = skill_loader.runtime_requirements
+                    self._plugin_reqs[skill_id] = requirements
                 if not network and requirements.network_before_load:
                     continue
                 if not internet and requirements.internet_before_load:
                     continue
                 self._load_plugin_skill(skill_id, plug)
+        self._last_plugin_scan = scan_state
 
     def _get_internal_skill_bus(self):
         if not self.config["websocket"].get("shared_connection", True):
@@ -362,13 +558,15 @@ class SkillManager(Thread):
             LOG.exception(f'Load of skill {skill_id} failed!')
             load_status = False
         finally:
+            skill_id = intern(skill_id)
             self.plugin_skills[skill_id] = skill_loader
+            self._by_skill_id[skill_id] = skill_loader
 
         return skill_loader if load_status else None
 
     def load_priority(self):
-        skill_ids = {os.path.basename(skill_path): skill_path
-                     for skill_path in self._get_skill_directories()}
+        self._get_skill_directories()  # refresh the scan cache
+        skill_ids = self._skill_id_map
         priority_skills = self.skills_config.get("priority_skills") or []
         if priority_skills:
             update_code = """priority skills have been deprecated and support will be removed in a future release
@@ -396,6 +594,7 @@ class SkillManager(Thread):
 
     def handle_initial_training(self, message):
         self.initial_load_complete = True
+        self._training_complete.set()
 
     def run(self):
         """Load skills and update periodically from disk and internet."""
@@ -422,13 +621,13 @@ class SkillManager(Thread):
             # trigger a sync so we dont need to wait for the plugin to volunteer info
             self._sync_skill_loading_state()
 
-        if "network_skills" in self.config.get("ready_settings"):
+        if "network_skills" in self._ready_settings:
             self._network_event.wait()  # Wait for user to connect to network
             if self._network_loaded.wait(self._network_skill_timeout):
                 LOG.debug("Network skills loaded")
             else:
                 LOG.error("Gave up waiting for network skills to load")
-        if "internet_skills" in self.config.get("ready_settings"):
+        if "internet_skills" in self._ready_settings:
             self._connected_event.wait()  # Wait for user to connect to network
             if self._internet_loaded.wait(self._network_skill_timeout):
                 LOG.debug("Internet skills loaded")
@@ -444,8 +643,7 @@ class SkillManager(Thread):
 
         # wait for initial intents training
         LOG.debug("Waiting for initial training")
-        while not self.initial_load_complete:
-            sleep(0.5)
+        self._training_complete.wait()
         self.status.set_ready()
 
         if self._gui_event.is_set() and self._connected_event.is_set():
@@ -457,12 +655,19 @@ class SkillManager(Thread):
 
         # Scan the file folder that contains Skills.  If a Skill is updated,
         # unload the existing version from memory and reload from the disk.
+        # rescans are driven by the directory watcher so an idle system no
+        # longer pays for a full scan every 2 seconds, the timeout acts as
+        # a safety net for missed FS events (and feeds a real watchdog at
+        # the old cadence when one was provided)
+        self._init_skills_watchdog()
+        scan_interval = 2 if self._has_watchdog else 30
         while not self._stop_event.is_set():
             try:
+                self._rescan_event.wait(timeout=scan_interval)
+                self._rescan_event.clear()
                 self._unload_removed_skills()
                 self._load_new_skills()
                 self._watchdog()
-                sleep(2)  # Pause briefly before beginning next scan
             except Exception:
                 LOG.exception('Something really unexpected has occurred '
                               'and the skill manager loop safety harness was '
@@ -472,10 +677,22 @@ class SkillManager(Thread):
     def _remove_git_locks(self):
         """If git gets killed from an abrupt shutdown it leaves lock files."""
         for skills_dir in get_skill_directories():
-            lock_path = os.path.join(skills_dir, '*/.git/index.lock')
-            for i in glob(lock_path):
-                LOG.warning('Found and removed git lock file: ' + i)
-                os.remove(i)
+            try:
+                entries = os.scandir(skills_dir)
+            except OSError:
+                continue
+            # one unlink attempt per skill folder beats glob, which walks
+            # every directory and stats each candidate
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=True):
+                        continue
+                    lock = os.path.join(entry.path, '.git', 'index.lock')
+                    try:
+                        os.remove(lock)
+                        LOG.warning('Found and removed git lock file: ' + lock)
+                    except OSError:  # no lock file, the common case
+                        pass
 
     def _load_on_network(self):
         LOG.info('Loading skills that require network...')
@@ -488,44 +705,59 @@ class SkillManager(Thread):
         self._internet_loaded.set()
         self._network_loaded.set()
 
+    def _get_requirements(self, skill_dir):
+        """RuntimeRequirements for a skill dir, cached on module mtime.
+
+        Reading runtime_requirements through a probe SkillLoader can
+        import the skill module; the result only changes when the main
+        module does, so cache it keyed on that file's mtime.
+        """
+        try:
+            mtime = os.stat(
+                os.path.join(skill_dir, SKILL_MAIN_MODULE)).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._req_cache.get(skill_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        requirements = self._get_skill_loader(
+            skill_dir, init_bus=False).runtime_requirements
+        self._req_cache[skill_dir] = (mtime, requirements)
+        return requirements
+
+    def _gather_unloads(self, predicate):
+        """List skill dirs whose runtime requirements match a predicate.
+
+        Only this read-only decision pass holds the manager lock; the
+        actual unloads run outside it so other handlers are not blocked
+        behind slow skill shutdowns.
+        """
+        with self._lock:
+            return [skill_dir for skill_dir in self._get_skill_directories()
+                    if predicate(self._get_requirements(skill_dir))]
+
     def _unload_on_network_disconnect(self):
         """ unload skills that require network to work """
-        with self._lock:
-            for skill_dir in self._get_skill_directories():
-                # by definition skill_id == folder name
-                skill_id = os.path.basename(skill_dir)
-                skill_loader = self._get_skill_loader(skill_dir, init_bus=False)
-                requirements = skill_loader.runtime_requirements
-                if requirements.requires_network and \
-                        not requirements.no_network_fallback:
-                    # unload until network is back
-                    self._unload_skill(skill_dir)
+        for skill_dir in self._gather_unloads(
+                lambda req: req.requires_network and
+                not req.no_network_fallback):
+            # unload until network is back
+            self._unload_skill(skill_dir)
 
     def _unload_on_internet_disconnect(self):
         """ unload skills that require internet to work """
-        with self._lock:
-            for skill_dir in self._get_skill_directories():
-                # by definition skill_id == folder name
-                skill_id = os.path.basename(skill_dir)
-                skill_loader = self._get_skill_loader(skill_dir, init_bus=False)
-                requirements = skill_loader.runtime_requirements
-                if requirements.requires_internet and \
-                        not requirements.no_internet_fallback:
-                    # unload until internet is back
-                    self._unload_skill(skill_dir)
+        for skill_dir in self._gather_unloads(
+                lambda req: req.requires_internet and
+                not req.no_internet_fallback):
+            # unload until internet is back
+            self._unload_skill(skill_dir)
 
     def _unload_on_gui_disconnect(self):
         """ unload skills that require gui to work """
-        with self._lock:
-            for skill_dir in self._get_skill_directories():
-                # by definition skill_id == folder name
-                skill_id = os.path.basename(skill_dir)
-                skill_loader = self._get_skill_loader(skill_dir, init_bus=False)
-                requirements = skill_loader.runtime_requirements
-                if requirements.requires_gui and \
-                        not requirements.no_gui_fallback:
-                    # unload until gui is back
-                    self._unload_skill(skill_dir)
+        for skill_dir in self._gather_unloads(
+                lambda req: req.requires_gui and not req.no_gui_fallback):
+            # unload until gui is back
+            self._unload_skill(skill_dir)
 
     def _load_on_startup(self):
         """Handle initial skill load."""
@@ -539,20 +771,30 @@ class SkillManager(Thread):
         if internet is None:
             internet = self._connected_event.is_set()
         if gui is None:
-            gui = self._gui_event.is_set() or is_gui_connected(self.bus)
+            gui = self._gui_event.is_set()
+            if not gui and not self._gui_probed:
+                # single probe for a GUI that connected before our
+                # handlers were registered, afterwards the
+                # available/unavailable events are authoritative
+                self._gui_probed = True
+                gui = is_gui_connected(self.bus)
+                if gui:
+                    self._gui_event.set()
 
         # a lock is used because this can be called via state events or as part of the main loop
         # there is a possible race condition where this handler would be executing several times otherwise
+        # only the decide-what-to-load bookkeeping runs under it, the module
+        # imports themselves happen outside (and concurrently)
         with self._lock:
 
             self.load_plugin_skills(network=network, internet=internet)
 
+            to_load = []
             for skill_dir in self._get_skill_directories():
-                replaced_skills = []
                 # by definition skill_id == folder name
-                skill_id = os.path.basename(skill_dir)
-                skill_loader = self._get_skill_loader(skill_dir, init_bus=False)
-                requirements = skill_loader.runtime_requirements
+                skill_id = self._skill_dir_map.get(skill_dir) or \
+                    os.path.basename(skill_dir)
+                requirements = self._get_requirements(skill_dir)
                 if not network and requirements.network_before_load:
                     continue
                 if not internet and requirements.internet_before_load:
@@ -566,18 +808,35 @@ class SkillManager(Thread):
                     LOG.info(f"{skill_id} plugin will be replaced by a local version: {skill_dir}")
                     self._unload_plugin_skill(skill_id)
 
-                for old_skill_dir, skill_loader in self.skill_loaders.items():
-                    if old_skill_dir != skill_dir and \
-                            skill_loader.skill_id == skill_id:
-                        # a higher priority equivalent has been detected!
-                        replaced_skills.append(old_skill_dir)
-
-                for old_skill_dir in replaced_skills:
+                old_skill_dir = self._loaded_skill_dirs.get(skill_id)
+                if old_skill_dir and old_skill_dir != skill_dir:
+                    # a higher priority equivalent has been detected!
                     # unload the old skill
                     self._unload_skill(old_skill_dir)
 
-                if skill_dir not in self.skill_loaders:
-                    self._load_skill(skill_dir)
+                if skill_dir not in self.skill_loaders and \
+                        skill_dir not in self._loading:
+                    self._loading.add(skill_dir)
+                    to_load.append(skill_dir)
+
+        if not to_load:
+            return
+        try:
+            if len(to_load) == 1:
+                self._load_skill(to_load[0])
+            else:
+                # skill load is dominated by disk reads and dependency
+                # imports, so threads overlap most of the wall clock time
+                workers = min(8, (os.cpu_count() or 1) * 2, len(to_load))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {executor.submit(self._load_skill, d): d
+                               for d in to_load}
+                    for future in as_completed(futures):
+                        if future.result() is None:
+                            LOG.error(f"Skill {futures[future]} "
+                                      f"failed to load")
+        finally:
+            self._loading.difference_update(to_load)
 
     def _get_skill_loader(self, skill_directory, init_bus=True):
         bus = None
@@ -593,7 +852,10 @@ class SkillManager(Thread):
             LOG.exception(f'Load of skill {skill_directory} failed!')
             load_status = False
         finally:
+            skill_id = intern(skill_loader.skill_id)
             self.skill_loaders[skill_directory] = skill_loader
+            self._by_skill_id[skill_id] = skill_loader
+            self._loaded_skill_dirs[skill_id] = skill_directory
 
         return skill_loader if load_status else None
 
@@ -606,24 +868,59 @@ class SkillManager(Thread):
             except Exception:
                 LOG.exception('Failed to shutdown skill ' + skill.id)
             del self.skill_loaders[skill_dir]
+            self._req_cache.pop(skill_dir, None)
+            if self._by_skill_id.get(skill.skill_id) is skill:
+                del self._by_skill_id[skill.skill_id]
+            if self._loaded_skill_dirs.get(skill.skill_id) == skill_dir:
+                del self._loaded_skill_dirs[skill.skill_id]
+
+    @staticmethod
+    def _dir_fingerprint(paths):
+        """{path: st_mtime_ns} snapshot, None for paths that went away."""
+        fingerprint = {}
+        for path in paths:
+            try:
+                fingerprint[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                fingerprint[path] = None
+        return fingerprint
 
     def _get_skill_directories(self):
+        # this runs every scan cycle and from the connectivity handlers,
+        # re-listing every skill folder each time is wasted syscalls; a
+        # directory mtime changes whenever an entry is added or removed,
+        # so a stat per watched directory is enough to validate the cache
+        roots = get_skill_directories()
+        if self._skill_dir_cache is not None \
+                and self._skill_dir_roots == set(roots) \
+                and self._dir_fingerprint(
+                    self._skill_dir_mtimes) == self._skill_dir_mtimes:
+            return self._skill_dir_cache
+
         # let's scan all valid directories, if a skill folder name exists in
         # more than one of these then it should override the previous
         skillmap = {}
-        for skills_dir in get_skill_directories():
-            if not os.path.isdir(skills_dir):
+        for skills_dir in roots:
+            try:
+                # DirEntry.is_dir reuses the stat data from the directory
+                # read, so this costs one readdir instead of a stat per entry
+                with os.scandir(skills_dir) as entries:
+                    for entry in entries:
+                        # NOTE: empty folders mean the skill should NOT be
+                        # loaded, hidden dirs (.git etc) are never skills
+                        if entry.is_dir(follow_symlinks=True) and \
+                                not entry.name.startswith('.'):
+                            # skill ids recur as dict keys and in loop
+                            # comparisons, interning makes those pointer
+                            # checks instead of byte-by-byte compares
+                            skillmap[intern(entry.name)] = entry.path
+            except OSError:  # missing or unreadable directory
                 continue
-            for skill_id in os.listdir(skills_dir):
-                skill = os.path.join(skills_dir, skill_id)
-                # NOTE: empty folders mean the skill should NOT be loaded
-                if os.path.isdir(skill):
-                    skillmap[skill_id] = skill
 
         for skill_id, skill_dir in skillmap.items():
             # TODO: all python packages must have __init__.py!  Better way?
             # check if folder is a skill (must have __init__.py)
-            if SKILL_MAIN_MODULE in os.listdir(skill_dir):
+            if os.path.isfile(os.path.join(skill_dir, SKILL_MAIN_MODULE)):
                 if skill_dir in self.empty_skill_dirs:
                     self.empty_skill_dirs.discard(skill_dir)
             else:
@@ -632,29 +929,39 @@ class SkillManager(Thread):
                     LOG.debug('Found skills directory with no skill: ' +
                               skill_dir)
 
-        return skillmap.values()
+        # watch the roots (entries added/removed) and the skill folders
+        # themselves (__init__.py created in a previously empty one)
+        self._skill_id_map = dict(skillmap)
+        self._skill_dir_map = {v: k for k, v in skillmap.items()}
+        self._skill_dir_cache = list(skillmap.values())
+        self._skill_dir_roots = set(roots)
+        self._skill_dir_mtimes = self._dir_fingerprint(
+            list(roots) + self._skill_dir_cache)
+        return self._skill_dir_cache
 
     def _unload_removed_skills(self):
         """Shutdown removed skills."""
-        skill_dirs = self._get_skill_directories()
-        # Find loaded skills that don't exist on disk
-        removed_skills = [
-            s for s in self.skill_loaders.keys() if s not in skill_dirs
-        ]
+        skill_dirs = set(self._get_skill_directories())
+        # Find loaded skills that don't exist on disk, C-level set diff
+        # instead of a linear membership test per loaded skill
+        removed_skills = list(self.skill_loaders.keys() - skill_dirs)
         for skill_dir in removed_skills:
             self._unload_skill(skill_dir)
         return removed_skills
 
     def _unload_plugin_skill(self, skill_id):
-        if skill_id in self.plugin_skills:
-            LOG.info('Unloading plugin skill: ' + skill_id)
-            skill_loader = self.plugin_skills[skill_id]
-            if skill_loader.instance is not None:
-                try:
-                    skill_loader.instance.default_shutdown()
-                except Exception:
-                    LOG.exception('Failed to shutdown plugin skill: ' + skill_loader.skill_id)
-            self.plugin_skills.pop(skill_id)
+        # single pop instead of a membership test + lookup + pop
+        skill_loader = self.plugin_skills.pop(skill_id, None)
+        if skill_loader is None:
+            return
+        LOG.info('Unloading plugin skill: ' + skill_id)
+        if skill_loader.instance is not None:
+            try:
+                skill_loader.instance.default_shutdown()
+            except Exception:
+                LOG.exception('Failed to shutdown plugin skill: ' + skill_loader.skill_id)
+        if self._by_skill_id.get(skill_id) is skill_loader:
+            del self._by_skill_id[skill_id]
 
     def is_alive(self, message=None):
         """Respond to is_alive status request."""
@@ -669,9 +976,8 @@ class SkillManager(Thread):
         try:
             message_data = {}
             # TODO handle external skills, OVOSAbstractApp/Hivemind skills are not accounted for
-            skills = {**self.skill_loaders, **self.plugin_skills}
-
-            for skill_loader in skills.values():
+            for skill_loader in chain(self.skill_loaders.values(),
+                                      self.plugin_skills.values()):
                 message_data[skill_loader.skill_id] = {
                     "active": skill_loader.active and skill_loader.loaded,
                     "id": skill_loader.skill_id}
@@ -680,57 +986,161 @@ class SkillManager(Thread):
         except Exception:
             LOG.exception('Failed to send skill list')
 
+    def _find_skill_loader(self, skill_id):
+        """Loader for a skill_id, index lookup with a linear fallback.
+
+        The fallback covers loaders inserted into skill_loaders /
+        plugin_skills directly rather than through _load_skill.
+        """
+        loader = self._by_skill_id.get(skill_id)
+        if loader is None:
+            for skill_loader in chain(self.skill_loaders.values(),
+                                      self.plugin_skills.values()):
+                if skill_loader.skill_id == skill_id:
+                    return skill_loader
+        return loader
+
+    def _emit_batch_state_change(self, message, activated=None,
+                                 deactivated=None):
+        """Emit one aggregate event for a bulk (de)activation.
+
+        The per-skill loaders emit their own events; listeners that only
+        care about the overall outcome can subscribe to the batch event
+        instead of processing N individual ones.
+        """
+        if not activated and not deactivated:
+            return
+        self.bus.emit(message.forward(
+            'mycroft.skills.state.batch_changed',
+            {'activated': activated or [],
+             'deactivated': deactivated or []}))
+
     def deactivate_skill(self, message):
         """Deactivate a skill."""
+        skill_id = message.data.get('skill')
+        if not skill_id:
+            LOG.warning('Deactivation request is missing a skill id')
+            return
+        # TODO handle external skills, OVOSAbstractApp/Hivemind skills are not accounted for
+        skill_loader = self._find_skill_loader(skill_id)
+        if skill_loader is None:
+            LOG.warning('Couldn\'t find skill %s to deactivate', skill_id)
+            return
+        LOG.info('Deactivating skill: %s', skill_id)
         try:
-            # TODO handle external skills, OVOSAbstractApp/Hivemind skills are not accounted for
-            skills = {**self.skill_loaders, **self.plugin_skills}
-            for skill_loader in skills.values():
-                if message.data['skill'] == skill_loader.skill_id:
-                    LOG.info("Deactivating skill: " + skill_loader.skill_id)
-                    skill_loader.deactivate()
+            skill_loader.deactivate()
         except Exception:
-            LOG.exception('Failed to deactivate ' + message.data['skill'])
+            LOG.exception('Failed to deactivate %s', skill_id)
 
     def deactivate_except(self, message):
         """Deactivate all skills except the provided."""
-        try:
-            skill_to_keep = message.data['skill']
-            LOG.info(f'Deactivating all skills except {skill_to_keep}')
-            # TODO handle external skills, OVOSAbstractApp/Hivemind skills are not accounted for
-            skills = {**self.skill_loaders, **self.plugin_skills}
-            for skill in skills.values():
-                if skill.skill_id != skill_to_keep:
-                    skill.deactivate()
-            LOG.info('Couldn\'t find skill ' + message.data['skill'])
-        except Exception:
-            LOG.exception('An error occurred during skill deactivation!')
+        skill_to_keep = message.data.get('skill')
+        if not skill_to_keep:
+            LOG.warning('Deactivation request is missing a skill id')
+            return
+        LOG.info('Deactivating all skills except %s', skill_to_keep)
+        # TODO handle external skills, OVOSAbstractApp/Hivemind skills are not accounted for
+        # deactivate() still does bus work on an inactive skill, so filter
+        # those out along with the one we keep before touching anything
+        to_deactivate = [skill for skill in
+                         chain(self.skill_loaders.values(),
+                               self.plugin_skills.values())
+                         if skill.active and skill.skill_id != skill_to_keep]
+        deactivated = []
+        for skill in to_deactivate:
+            try:
+                skill.deactivate()
+                deactivated.append(skill.skill_id)
+            except Exception:
+                LOG.exception('Failed to deactivate %s', skill.skill_id)
+        self._emit_batch_state_change(message, deactivated=deactivated)
+
+    def _lazy_load(self, skill_id):
+        """Load an installed but not yet loaded skill on demand.
+
+        Lets an explicit activation request bring up a skill whose load
+        was gated (eg by runtime requirements) without waiting for the
+        gate to clear.
+        """
+        self._get_skill_directories()  # refresh the scan cache
+        skill_dir = self._skill_id_map.get(skill_id)
+        if skill_dir is not None and skill_dir not in self.skill_loaders:
+            LOG.info(f"Loading {skill_id} on activation request")
+            return self._load_skill(skill_dir)
+        plug = (self._plugin_cache or {}).get(skill_id)
+        if plug is not None and skill_id not in self.plugin_skills:
+            LOG.info(f"Loading plugin {skill_id} on activation request")
+            return self._load_plugin_skill(skill_id, plug)
+        return None
 
     def activate_skill(self, message):
         """Activate a deactivated skill."""
-        try:
-            # TODO handle external skills, OVOSAbstractApp/Hivemind skills are not accounted for
-            skills = {**self.skill_loaders, **self.plugin_skills}
-            for skill_loader in skills.values():
-                if (message.data['skill'] in ('all', skill_loader.skill_id)
-                        and not skill_loader.active):
-                    skill_loader.activate()
-        except Exception:
-            LOG.exception('Couldn\'t activate skill')
+        target = message.data.get('skill')
+        if not target:
+            LOG.warning('Activation request is missing a skill id')
+            return
+        # TODO handle external skills, OVOSAbstractApp/Hivemind skills are not accounted for
+        if target == 'all':
+            activated = []
+            for skill_loader in chain(self.skill_loaders.values(),
+                                      self.plugin_skills.values()):
+                if not skill_loader.active:
+                    try:
+                        skill_loader.activate()
+                        activated.append(skill_loader.skill_id)
+                    except Exception:
+                        LOG.exception('Couldn\'t activate skill %s',
+                                      skill_loader.skill_id)
+            self._emit_batch_state_change(message, activated=activated)
+            return
+        skill_loader = self._find_skill_loader(target)
+        if skill_loader is None:
+            skill_loader = self._lazy_load(target)
+        if skill_loader is not None and not skill_loader.active:
+            try:
+                skill_loader.activate()
+            except Exception:
+                LOG.exception('Couldn\'t activate skill %s', target)
 
     def stop(self):
         """Tell the manager to shutdown."""
         self.status.set_stopping()
         self._stop_event.set()
-
-        # Do a clean shutdown of all skills
-        for skill_loader in self.skill_loaders.values():
-            if skill_loader.instance is not None:
-                _shutdown_skill(skill_loader.instance)
-
-        # Do a clean shutdown of all plugin skills
-        for skill_id in list(self.plugin_skills.keys()):
-            self._unload_plugin_skill(skill_id)
-
+        self._rescan_event.set()  # wake the scan loop so it can exit
+
+        # Do a clean shutdown of all skills and plugin skills, shutdown
+        # is mostly bus and file teardown so running them concurrently
+        # brings total time down to roughly the slowest single skill
+        instances = [skill_loader.instance
+                     for skill_loader in self.skill_loaders.values()
+                     if skill_loader.instance is not None]
+        # snapshot so the pops in _unload_plugin_skill don't mutate the
+        # dict we are iterating
+        plugin_ids = tuple(self.plugin_skills)
+        if instances or plugin_ids:
+            executor = ThreadPoolExecutor(
+                max_workers=min(16, len(instances) + len(plugin_ids)))
+            futures = {executor.submit(_shutdown_skill, instance):
+                       instance.skill_id for instance in instances}
+            futures.update(
+                {executor.submit(self._unload_plugin_skill, skill_id):
+                 skill_id for skill_id in plugin_ids})
+            _, pending = wait(futures, timeout=_SHUTDOWN_TIMEOUT)
+            if pending:
+                # sync skill code cannot be cancelled, name the offenders
+                # and leave their threads behind rather than hang shutdown
+                hung = ", ".join(sorted(futures[f] for f in pending))
+                LOG.warning(f"Skill shutdown timed out after "
+                            f"{_SHUTDOWN_TIMEOUT}s, not waiting for: {hung}")
+            executor.shutdown(wait=False)
+
+        # cancel any pending debounced settings notifications before the
+        # watcher goes away
+        with self._settings_lock:
+            for timer, _ in self._pending_settings.values():
+                timer.cancel()
+            self._pending_settings.clear()
         if self._settings_watchdog:
             self._settings_watchdog.shutdown()
+        if self._skills_watchdog:
+            self._skills_watchdog.shutdown()
@@ -354,6 +354,39 @@ class TestIntentServiceApi(TestCase):
         self.assertEqual(reply.data['intent'], None)
 
 
+class TestMatchRouteInvalidation(TestCase):
+    """Learned match routes must be dropped when a new potential winner
+    appears, or stale hints would bypass it on exact repeats."""
+
+    def setUp(self):
+        self.intent_service = IntentService(mock.Mock())
+        # the clearing handler is registered per event on the bus mock
+        self.clear_handlers = {}
+        for call in self.intent_service.bus.on.call_args_list:
+            event, handler = call[0]
+            if getattr(handler, '__name__', '') == '_clear_match_route':
+                self.clear_handlers[event] = handler
+
+    def test_cleared_on_new_potential_winner(self):
+        for event in ('ovos.skills.fallback.register',
+                      'ovos.skills.fallback.deregister',
+                      'mycroft.skills.loaded',
+                      'padatious:register_intent',
+                      'padatious:register_entity',
+                      'mycroft.skills.trained'):
+            self.assertIn(event, self.clear_handlers)
+            self.intent_service._match_route[(hash('test'), 'en-us')] = 1
+            self.clear_handlers[event](Message(event))
+            self.assertEqual({}, self.intent_service._match_route,
+                             f'{event} did not clear the match routes')
+
+    def test_cleared_on_adapt_registration(self):
+        self.intent_service._match_route[(hash('test'), 'en-us')] = 1
+        self.intent_service.handle_register_vocab(
+            create_vocab_msg('testKeyword', 'test'))
+        self.assertEqual({}, self.intent_service._match_route)
+
+
 class TestAdaptIntent(TestCase):
     """Test the AdaptIntent wrapper."""
     def test_named_intent(self):
@@ -101,8 +101,12 @@ class TestSkillManager(MycroftUnitTestBase):
             'skillmanager.deactivate',
             'skillmanager.keep',
             'skillmanager.activate',
+            'ovos.skills.plugins.rescan',
+            'configuration.updated',
+            'configuration.patch',
             'mycroft.skills.initialized',
             'mycroft.skills.trained',
+            'ovos.setup.finished',
             'mycroft.network.connected',
             'mycroft.internet.connected',
             'mycroft.gui.available',
@@ -164,10 +168,13 @@ class TestSkillManager(MycroftUnitTestBase):
         self.skill_loader_mock.active = True
         foo_skill_loader = Mock(spec=SkillLoader)
         foo_skill_loader.skill_id = 'foo'
+        foo_skill_loader.active = True
         foo2_skill_loader = Mock(spec=SkillLoader)
         foo2_skill_loader.skill_id = 'foo2'
+        foo2_skill_loader.active = True
         test_skill_loader = Mock(spec=SkillLoader)
         test_skill_loader.skill_id = 'test_skill'
+        test_skill_loader.active = True
         self.skill_manager.skill_loaders['foo'] = foo_skill_loader
         self.skill_manager.skill_loaders['foo2'] = foo2_skill_loader
         self.skill_manager.skill_loaders['test_skill'] = test_skill_loader